@@ -1,9 +1,10 @@
 # coding: utf-8
 
 # Standard Python libraries
+from __future__ import annotations
 import datetime
 import io
-from typing import Generator, Optional, Union, Tuple
+from typing import Generator, Optional, Union, Tuple, TYPE_CHECKING
 
 # https://github.com/usnistgov/DataModelDict
 from DataModelDict import DataModelDict as DM
@@ -15,14 +16,46 @@ import numpy.typing as npt
 # https://pandas.pydata.org/
 import pandas as pd
 
-# https://matplotlib.org/
-import matplotlib.pyplot as plt
-
 # atomman imports 
 from .. import Atoms, Box, System
 from ..tools import aslist
 import atomman.unitconvert as uc
 
+if TYPE_CHECKING:
+    # https://matplotlib.org/
+    import matplotlib.pyplot as plt
+
+def _r_jk_grid(rvals: np.ndarray,
+               costvals: np.ndarray) -> np.ndarray:
+    """
+    Computes the r_jk values for a regular grid of r_ij, r_ik and theta
+    values.  The r products are only evaluated on the 2D sub-grid and all
+    full grid operations are done in place on the returned array.
+
+    Parameters
+    ----------
+    rvals : numpy.ndarray
+        The 1D values used for both r_ij and r_ik.
+    costvals : numpy.ndarray
+        The cosines of the 1D theta values.
+
+    Returns
+    -------
+    numpy.ndarray
+        The flattened r_jk values ordered with r_ij iterating in the outside
+        loop, r_ik in the middle and theta in the inside.
+    """
+    rsq = rvals**2
+    r_jk = np.empty((len(rvals), len(rvals), len(costvals)), dtype=rvals.dtype)
+
+    # r_jk = sqrt(r_ij^2 + r_ik^2 - 2 r_ij r_ik cos(theta))
+    np.multiply(np.multiply.outer(rvals, -2 * rvals)[:, :, None],
+                costvals, out=r_jk)
+    np.add(r_jk, np.add.outer(rsq, rsq)[:, :, None], out=r_jk)
+    np.sqrt(r_jk, out=r_jk)
+
+    return r_jk.reshape(-1)
+
 class BondAngleMap():
     """
     Class for generating and analyzing energies of three atom clusters that
@@ -42,7 +75,8 @@ class BondAngleMap():
                  r_ik: Optional[npt.ArrayLike] = None,
                  theta: Optional[npt.ArrayLike] = None,
                  energy: Optional[npt.ArrayLike] = None,
-                 symbols: Union[str, list, None] = None):
+                 symbols: Union[str, list, None] = None,
+                 dtype: npt.DTypeLike = np.float64):
         """
         Class initializer.  The cluster coordinates (r distances and theta
         angles) are required and can be specified in one of three ways.
@@ -92,8 +126,13 @@ class BondAngleMap():
             all atoms, or three symbols to assign to atoms i, j, and k
             individually.  Not needed if systems are not generated by this
             class.
+        dtype : data-type, optional
+            The floating point data type used to store the coordinates and
+            energies.  Default value is numpy.float64.  numpy.float32 halves
+            the memory of large maps at the cost of precision.
         """
         self.symbols = symbols
+        self.__dtype = np.dtype(dtype)
         if model is not None:
             try:
                 assert rmin is None and rmax is None and rnum is None
@@ -138,11 +177,67 @@ class BondAngleMap():
         """int or None: The number of values used for the theta angles."""
         return self.__thetanum
 
+    @property
+    def dtype(self) -> np.dtype:
+        """numpy.dtype: The data type used to store the coordinates and energies."""
+        return self.__dtype
+
+    @property
+    def theta_rad(self) -> np.ndarray:
+        """numpy.ndarray: The theta angles of all clusters in radians."""
+        return self.__theta_rad
+
     @property
     def df(self) -> pd.DataFrame:
-        """pandas.Dataframe : The cluster coordinates and energies."""
+        """
+        pandas.Dataframe : The cluster coordinates and energies.  Changes
+        made to the energy column through this attribute are used by the
+        other methods.  Saved pdf results are reset each time df is
+        accessed, so edit the energies through df or energy rather than
+        through a previously retrieved DataFrame.
+        """
+        if self.__df is None:
+            df = {}
+            df['r_ij'] = self.__r_ij
+            df['r_ik'] = self.__r_ik
+            df['r_jk'] = self.__r_jk
+            df['theta'] = self.__theta
+            df['energy'] = self.__energy
+            self.__df = pd.DataFrame(df, copy=False)
+
+        # The energies may be changed through df so reset saved pdf results
+        self.__pdf_cache = {}
         return self.__df
 
+    @property
+    def energy(self) -> np.ndarray:
+        """numpy.ndarray : The energies of the clusters (read-only view)."""
+        energy = self.__current_energy().view()
+        energy.flags.writeable = False
+        return energy
+
+    @energy.setter
+    def energy(self, value: npt.ArrayLike):
+        value = np.ascontiguousarray(value, dtype=self.dtype)
+        if value.shape != self.__r_ij.shape:
+            raise ValueError('Mismatch between number of energies given and expected')
+
+        self.__energy = value
+        if self.__df is not None:
+            self.__df['energy'] = value
+
+        # Reset saved pdf results
+        self.__pdf_cache = {}
+
+    def __current_energy(self) -> np.ndarray:
+        """
+        Returns the energy array.  Once df has been built its energy column
+        is used, which is not copied unless its dtype was changed.
+        """
+        if self.__df is not None:
+            self.__energy = self.__df['energy'].to_numpy(dtype=self.dtype, copy=False)
+        return self.__energy
+
     @property
     def symbols(self) -> Optional[list]:
         """list or None: the atomic symbols associated with the three atoms"""
@@ -158,6 +253,15 @@ class BondAngleMap():
         
         self.__symbols = value
 
+        # Identify atypes and unique model symbols used when building systems
+        if value is not None and len(value) == 3:
+            unique_symbols, atype = np.unique(value, return_inverse=True)
+            self.__atype = atype + 1
+            self.__unique_symbols = unique_symbols.tolist()
+        else:
+            self.__atype = np.array([1, 1, 1])
+            self.__unique_symbols = value
+
     def model(self,
               model: Union[str, io.IOBase, DM, None] = None,
               length_unit: str = 'angstrom',
@@ -230,7 +334,9 @@ class BondAngleMap():
             cluster['maximum-angle'] = self.thetamax
             cluster['number-of-angles'] = self.thetanum
 
-            cluster['energy'] = uc.model(self.df.energy, energy_unit)
+            # Convert units on the full float64 array in one operation
+            energy = np.asarray(self.__current_energy(), dtype=np.float64)
+            cluster['energy'] = uc.model(energy, energy_unit)
 
             return model
 
@@ -244,7 +350,8 @@ class BondAngleMap():
             r_ij: Optional[npt.ArrayLike] = None,
             r_ik: Optional[npt.ArrayLike] = None,
             theta: Optional[npt.ArrayLike] = None,
-            energy: Optional[npt.ArrayLike] = None):
+            energy: Optional[npt.ArrayLike] = None,
+            dtype: Optional[npt.DTypeLike] = None):
         """
         Sets the bond angle coordinates and the associated energies, if given.
 
@@ -284,15 +391,20 @@ class BondAngleMap():
             iterating in the outside loop, r_ik in the middle and theta in the
             inside.  If energy is not given, then all values will initially be
             set to np.nan.
+        dtype : data-type, optional
+            The floating point data type used to store the coordinates and
+            energies.  If not given, the current dtype setting is retained.
         """
+        if dtype is not None:
+            self.__dtype = np.dtype(dtype)
 
         # Set coordinate values based on ranges
         if rmin is not None:
             if r_ij is not None or r_ik is not None or theta is not None:
                 raise ValueError('range parameters and explicit values cannot be mixed')
             try:
-                rvals = np.linspace(rmin, rmax, rnum)
-                tvals = np.linspace(thetamin, thetamax, thetanum)
+                rvals = np.linspace(rmin, rmax, rnum, dtype=self.dtype)
+                tvals = np.linspace(thetamin, thetamax, thetanum, dtype=self.dtype)
             except Exception as e:
                 raise ValueError('Invalid range parameters') from e
 
@@ -304,11 +416,21 @@ class BondAngleMap():
             self.__thetamax = thetamax
             self.__thetanum = thetanum
 
-            # Generate the input parameters
-            r_ij, r_ik, theta = np.meshgrid(rvals, rvals, tvals, indexing='ij')
-            r_ij = r_ij.flatten()
-            r_ik = r_ik.flatten()
-            theta = theta.flatten()
+            # Evaluate trig functions for the unique theta values only
+            trad = np.radians(tvals)
+            costvals = np.cos(trad)
+            sintvals = np.sin(trad)
+
+            # Compute r_jk values directly on the grid
+            r_jk = _r_jk_grid(rvals, costvals)
+
+            # Generate the flattened input parameters
+            r_ij = np.repeat(rvals, rnum * thetanum)
+            r_ik = np.tile(np.repeat(rvals, thetanum), rnum)
+            theta = np.tile(tvals, rnum * rnum)
+            theta_rad = np.tile(trad, rnum * rnum)
+            cos_theta = np.tile(costvals, rnum * rnum)
+            sin_theta = np.tile(sintvals, rnum * rnum)
 
         # Explicitly set coordinate values
         else:
@@ -330,20 +452,22 @@ class BondAngleMap():
             # Try to extract range parameters
             rmin = r_ij.min()
             rmax = r_ij.max()
-            rnum = len(np.unique(r_ij))
-
             thetamin = theta.min()
             thetamax = theta.max()
-            thetanum = len(np.unique(theta))
 
             try:
+                # Infer the grid size from where r_ik first changes
+                thetanum = int(np.argmax(r_ik != r_ik[0])) or len(theta)
+                rnum = int(round((len(r_ij) / thetanum) ** 0.5))
                 assert len(r_ij) == thetanum * rnum * rnum
+
+                # Compare values to the regular grid without building it
                 rvals = np.linspace(rmin, rmax, rnum)
                 tvals = np.linspace(thetamin, thetamax, thetanum)
-                r_ij_test, r_ik_test, theta_test = np.meshgrid(rvals, rvals, tvals, indexing='ij')
-                assert np.allclose(r_ij, r_ij_test.flatten())
-                assert np.allclose(r_ik, r_ik_test.flatten())
-                assert np.allclose(theta, theta_test.flatten())
+                shape = (rnum, rnum, thetanum)
+                assert np.allclose(r_ij.reshape(shape), rvals[:, None, None])
+                assert np.allclose(r_ik.reshape(shape), rvals[None, :, None])
+                assert np.allclose(theta.reshape(shape), tvals[None, None, :])
             except:
                 # Set range parameters as None to indicate not correctly ordered
                 self.__rmin = None
@@ -360,24 +484,36 @@ class BondAngleMap():
                 self.__thetamin = thetamin
                 self.__thetamax = thetamax
                 self.__thetanum = thetanum
-        
+
+            # Compute r_jk values
+            theta_rad = np.radians(theta)
+            cos_theta = np.cos(theta_rad)
+            sin_theta = np.sin(theta_rad)
+            r_jk = np.sqrt(r_ij * r_ij + r_ik * r_ik - r_ij * r_ik * 2 * cos_theta)
+
         # Check energy values
         if energy is None:
             energy = np.full(len(r_ij), np.nan)
         elif len(energy) != len(r_ij):
             raise ValueError('Mismatch between number of energies given and expected')
 
-        # Compute r_jk values
-        r_jk = np.sqrt(r_ij**2 + r_ik**2 - r_ij * r_ik * 2 * np.cos(np.radians(theta)))
+        # Store values as contiguous arrays
+        self.__r_ij = np.ascontiguousarray(r_ij, dtype=self.dtype)
+        self.__r_ik = np.ascontiguousarray(r_ik, dtype=self.dtype)
+        self.__r_jk = np.ascontiguousarray(r_jk, dtype=self.dtype)
+        self.__theta = np.ascontiguousarray(theta, dtype=self.dtype)
+        self.__energy = np.ascontiguousarray(energy, dtype=self.dtype)
 
-        # Build DataFrame
-        df = {}
-        df['r_ij'] = r_ij
-        df['r_ik'] = r_ik
-        df['r_jk'] = r_jk
-        df['theta'] = theta
-        df['energy'] = energy
-        self.__df = pd.DataFrame(df)
+        # Store angle values used for building cluster positions
+        self.__theta_rad = np.ascontiguousarray(theta_rad, dtype=self.dtype)
+        self.__cos_theta = np.ascontiguousarray(cos_theta, dtype=self.dtype)
+        self.__sin_theta = np.ascontiguousarray(sin_theta, dtype=self.dtype)
+
+        # DataFrame is built from the arrays when first accessed
+        self.__df = None
+
+        # Reset saved pdf results
+        self.__pdf_cache = {}
 
     def itercoords(self) -> Generator[Tuple[float, float, float, float], None, None]:
         """
@@ -395,9 +531,7 @@ class BondAngleMap():
         theta : float
             The angle between i-j and i-k in degrees.
         """
-        for i in self.df.index:
-            series = self.df.loc[i]
-            yield series.r_ij, series.r_ik, series.r_jk, series.theta
+        yield from zip(self.__r_ij, self.__r_ik, self.__r_jk, self.__theta)
 
     def itersystem(self,
                    symbols: Union[str, list, None] = None,
@@ -428,37 +562,37 @@ class BondAngleMap():
         # Set symbols
         if symbols is not None:
             self.symbols = symbols 
-        symbols = self.symbols
+        symbols = self.__unique_symbols
+        atype = self.__atype.copy()
 
         # Identify box bounds based on r_ij values
-        rhi = 3 * self.df.r_ij.max()
+        rhi = 3 * self.__r_ij.max()
         rlo = - rhi
-        
-        # Identify atypes from symbols
-        if symbols is None or len(symbols) == 1:
-            atype = np.array([1,1,1])
-        elif len(symbols) == 3:
-            symbols, atype = np.unique(symbols, return_inverse=True)
-        else:
-            print(symbols)
-            raise ValueError('Invalid symbols somehow...')
+
+        # Compute all non-zero coordinates at once
+        j_x = self.__r_ij
+        k_x = self.__r_ik * self.__cos_theta
+        k_y = self.__r_ik * self.__sin_theta
 
         # Copy = True means generate new system each iteration
         if copy:
-            for r_ij, r_ik, r_jk, theta in self.itercoords():
+            blocksize = 1000
+            for start in range(0, len(j_x), blocksize):
+                end = start + blocksize
+
+                # Fill the pos arrays for a block of clusters at once
+                pos_block = np.zeros((len(j_x[start:end]), 3, 3))
+                pos_block[:, 1, 0] = j_x[start:end]
+                pos_block[:, 2, 0] = k_x[start:end]
+                pos_block[:, 2, 1] = k_y[start:end]
 
-                # Build the pos array
-                j_x = r_ij
-                k_x = r_ik * np.cos(np.radians(theta))
-                k_y = r_ik * np.sin(np.radians(theta))
-                pos = np.array([[0.0, 0.0, 0.0],
-                                [j_x, 0.0, 0.0],
-                                [k_x, k_y, 0.0]])
+                for pos in pos_block:
 
-                # Build and yield a new system
-                box = Box(xlo=rlo, xhi=rhi, ylo=rlo, yhi=rhi, zlo=-1.0, zhi=1.0)
-                atoms = Atoms(atype=atype, pos=pos)
-                yield System(atoms=atoms, box=box, symbols=symbols, pbc=[False, False, False])
+                    # Build and yield a new system
+                    box = Box(xlo=rlo, xhi=rhi, ylo=rlo, yhi=rhi, zlo=-1.0, zhi=1.0)
+                    # Copy pos so the system does not keep the whole block alive
+                    atoms = Atoms(atype=atype, pos=pos.copy())
+                    yield System(atoms=atoms, box=box, symbols=symbols, pbc=[False, False, False])
 
         # Copy = False means only generate one system and modify pos
         else:
@@ -466,13 +600,16 @@ class BondAngleMap():
             box = Box(xlo=rlo, xhi=rhi, ylo=rlo, yhi=rhi, zlo=-1.0, zhi=1.0)
             atoms = Atoms(atype=atype, pos=np.zeros([3,3]))
             system = System(atoms=atoms, box=box, symbols=symbols, pbc=[False, False, False])
-        
-            for r_ij, r_ik, r_jk, theta in self.itercoords():
-                
+
+            # Bind the pos array once rather than looking it up every iteration
+            pos = system.atoms.pos
+
+            for jx, kx, ky in zip(j_x, k_x, k_y):
+
                 # Modify the three non-zero coordinates
-                system.atoms.pos[1,0] = r_ij
-                system.atoms.pos[2,0] = r_ik * np.cos(np.radians(theta))
-                system.atoms.pos[2,1] = r_ik * np.sin(np.radians(theta))
+                pos[1,0] = jx
+                pos[2,0] = kx
+                pos[2,1] = ky
 
                 yield system
             
@@ -489,10 +626,11 @@ class BondAngleMap():
         include_header : bool
             If True (default) then header comments will be listed at the top of the file.
         """
+        energy = self.__current_energy()
         with open(filename, 'w', encoding='UTF-8') as f:
 
             if include_header:
-                emin = self.df.energy.min()
+                emin = np.fmin.reduce(energy)
 
                 # Create the header comment lines
                 f.write(f'# Comment: this is a file containing an r12, r13, theta - energy-block E(r12, r13, theta) E_min={emin:18.14} eV\n')
@@ -508,12 +646,16 @@ class BondAngleMap():
                 f.write(f'{self.rmin:18.14} {self.rmax:18.14} {self.rnum}\n')
                 f.write(f'{self.thetamin:18.14} {self.thetamax:18.14} {self.thetanum}\n')
 
-            l = 0
-            for i in range(self.rnum):
-                for j in range(self.rnum):
-                    for k in range(self.thetanum):
-                        f.write(f'{i+1:6} {j+1:6} {k+1:6} {self.df.energy.values[l]:18.14}\n')
-                        l += 1
+            # Build the index columns for the embedded i, j, k loops
+            i, j, k = np.indices((self.rnum, self.rnum, self.thetanum)).reshape(3, -1) + 1
+
+            # Format and write the data lines in large blocks
+            blocksize = 100000
+            for start in range(0, len(energy), blocksize):
+                end = start + blocksize
+                f.write(''.join(f'{i_:6} {j_:6} {k_:6} {e:18.14}\n' for i_, j_, k_, e
+                                in zip(i[start:end].tolist(), j[start:end].tolist(),
+                                       k[start:end].tolist(), energy[start:end].tolist())))
 
     def load_table(self,
                    filename: str,
@@ -534,48 +676,51 @@ class BondAngleMap():
         """
 
         with open(filename, encoding='UTF-8') as f:
-            lines = f.readlines()
-
-        count = 0
-        energies = []
-        i = 1
-        j = 1
-        k = 1
-        for line in lines:
-            terms = line.split()
-            if line.strip()[0] == '#' or len(terms) == 0:
-                continue
-            
-            # Get r_ij min, max, num 
-            if count == 0:
-                rmin = float(terms[0])
-                rmax = float(terms[1])
-                rnum = int(terms[2])
-                count += 1
-            
-            # Check r_ik min, max, num 
-            elif count == 1:
-                assert np.isclose(rmin, float(terms[0])), 'only identical rij and rik ranges currently supported'
-                assert np.isclose(rmax, float(terms[1])), 'only identical rij and rik ranges currently supported'
-                assert np.isclose(rnum, int(terms[2])), 'only identical rij and rik ranges currently supported'
-                count += 1
-
-            # Get theta min, max, num 
-            elif count == 2:
-                thetamin = float(terms[0])
-                thetamax = float(terms[1])
-                thetanum = int(terms[2])
-                count += 1
-                energies = np.empty(rnum*rnum*thetanum)
-            
-            # Get energies
-            else:
-                i = int(terms[0]) - 1
-                j = int(terms[1]) - 1
-                k = int(terms[2]) - 1
-                index = k + j * thetanum + i * rnum * thetanum
-                energies[index] = float(terms[3])
-        
+
+            # Read the three range lines that follow the header comments
+            ranges = []
+            while len(ranges) < 3:
+                line = f.readline()
+                if line == '':
+                    raise ValueError('table file is missing range lines')
+                terms = line.split()
+                if len(terms) == 0 or terms[0][0] == '#':
+                    continue
+                ranges.append(terms)
+
+            # Read the remaining index, energy data block all at once
+            data = pd.read_csv(f, sep=r'\s+', comment='#', header=None,
+                               names=['i', 'j', 'k', 'energy'],
+                               dtype={'i': np.int64, 'j': np.int64, 'k': np.int64,
+                                      'energy': np.float64})
+
+        # Get r_ij min, max, num
+        rmin = float(ranges[0][0])
+        rmax = float(ranges[0][1])
+        rnum = int(ranges[0][2])
+
+        # Check r_ik min, max, num
+        assert np.isclose(rmin, float(ranges[1][0])), 'only identical rij and rik ranges currently supported'
+        assert np.isclose(rmax, float(ranges[1][1])), 'only identical rij and rik ranges currently supported'
+        assert np.isclose(rnum, int(ranges[1][2])), 'only identical rij and rik ranges currently supported'
+
+        # Get theta min, max, num
+        thetamin = float(ranges[2][0])
+        thetamax = float(ranges[2][1])
+        thetanum = int(ranges[2][2])
+
+        # Get energies
+        i = data.i.to_numpy() - 1
+        j = data.j.to_numpy() - 1
+        k = data.k.to_numpy() - 1
+        index = k + j * thetanum + i * rnum * thetanum
+        if np.array_equal(index, np.arange(rnum*rnum*thetanum)):
+            # Rows are already in loop order, as written by save_table
+            energies = data.energy.to_numpy()
+        else:
+            energies = np.empty(rnum*rnum*thetanum)
+            energies[index] = data.energy.to_numpy()
+
         # Convert units 
         rmin = uc.set_in_units(rmin, length_unit)
         rmax = uc.set_in_units(rmax, length_unit)  
@@ -608,15 +753,38 @@ class BondAngleMap():
             The center values for each bin.
         """
 
-        hist, edges = np.histogram(self.df.energy, bins=nbins, range=(energymin, energymax))
+        pdf, centers, shift = self.__pdf_data(nbins, energymin, energymax)
+
+        return pdf.copy(), centers.copy()
+
+    def __pdf_data(self,
+                   nbins: int,
+                   energymin: float,
+                   energymax: float) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Computes the pdf, bin centers and fraction of energies below energymin
+        in a single histogram pass.  Results are saved and reused for
+        subsequent calls with the same bin parameters.
+        """
+        # Reuse results from a previous call with the same bin parameters
+        energy = self.__current_energy()
+        key = (nbins, energymin, energymax)
+        if key not in self.__pdf_cache:
+
+            # Add a leading bin that collects all energies below energymin
+            edges = np.linspace(energymin, energymax, nbins + 1)
+            hist, _ = np.histogram(energy, bins=np.concatenate([[-np.inf], edges]))
 
-        # Divide the historgram count by total number of measurements
-        pdf = hist/len(self.df)
+            # Divide the historgram count by total number of measurements
+            pdf = hist[1:] / len(energy)
+            shift = hist[0] / len(energy)
 
-        # Average the bin edges to get the bin centers
-        centers = (edges[:-1] + edges[1:]) / 2
+            # Average the bin edges to get the bin centers
+            centers = (edges[:-1] + edges[1:]) / 2
 
-        return pdf, centers
+            self.__pdf_cache[key] = (pdf, centers, shift)
+
+        return self.__pdf_cache[key]
 
     def cumulative_pdf(self, 
                        nbins: int = 301,
@@ -642,16 +810,13 @@ class BondAngleMap():
             The center values for each bin.
         """
 
-        # Get pdf and centers in the range
-        pdf, centers = self.pdf(nbins=nbins, energymin=energymin, energymax=energymax)
-
-        # Calculate cumulative pdf below energymin
-        shift = np.sum(self.df.energy < energymin) / len(self.df)
+        # Get pdf, centers and cumulative pdf below energymin
+        pdf, centers, shift = self.__pdf_data(nbins, energymin, energymax)
 
         # Calculate the cumulative sum of pdf and apply the shift
         cum_pdf = np.cumsum(pdf) + shift
 
-        return cum_pdf, centers
+        return cum_pdf, centers.copy()
 
     def plot_pdf(self,
                  nbins: int = 301,
@@ -688,6 +853,10 @@ class BondAngleMap():
 
         # Initial plot setup and parameters
         if matplotlib_axes is None:
+            
+            # https://matplotlib.org/
+            import matplotlib.pyplot as plt
+
             fig = plt.figure(**kwargs)
             ax1 = fig.add_subplot(111)
         else:
@@ -737,6 +906,10 @@ class BondAngleMap():
 
         # Initial plot setup and parameters
         if matplotlib_axes is None:
+            
+            # https://matplotlib.org/
+            import matplotlib.pyplot as plt
+
             fig = plt.figure(**kwargs)
             ax1 = fig.add_subplot(111)
         else:
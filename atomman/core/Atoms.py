@@ -107,7 +107,9 @@ class Atoms(object):
             set all atypes to 1.
         pos : list/ndarray of float, optional
             The atomic positions to assign to all atoms.  Default is to set
-            each atom's position to [0,0,0].
+            each atom's position to [0,0,0].  Float arrays keep their dtype,
+            so float32 can be used to halve the position storage; other
+            values are converted to float64.
         model : str or DataModelDict, optional
             File path or content of a JSON/XML data model containing all
             atom information.  Cannot be given with any other parameters.
@@ -173,7 +175,12 @@ class Atoms(object):
         
         # Check pos parameter values
         if pos is not None:
+            
+            # Store pos as its own contiguous array of floats
             pos = np.asarray(pos)
+            if pos.dtype.kind != 'f':
+                pos = pos.astype('float64')
+            pos = np.ascontiguousarray(pos)
             
             # Handle single pos
             if pos.ndim == 1:
@@ -60,6 +60,21 @@ class Box(Shape, object):
             else:
                 self.set(**kwargs)
 
+    def __deepcopy__(self, memo) -> Box:
+        """Copies the box arrays directly"""
+        box = type(self).__new__(type(self))
+        memo[id(self)] = box
+        box.__vects = self.__vects.copy()
+        box.__origin = self.__origin.copy()
+        box.__reciprocal_vects = None
+
+        # Copy any user-defined attributes
+        for key, value in self.__dict__.items():
+            if key not in box.__dict__:
+                box.__dict__[key] = deepcopy(value, memo)
+
+        return box
+
     @classmethod
     def cubic(cls, a: float) -> Box:
         """
@@ -245,7 +260,7 @@ class Box(Shape, object):
     @property
     def vects(self) -> np.ndarray:
         """numpy.ndarray : Array containing all three box vectors.  Can be set directly."""
-        return deepcopy(self.__vects)
+        return self.__vects.copy()
 
     @vects.setter
     def vects(self, value: npt.ArrayLike):
@@ -261,17 +276,31 @@ class Box(Shape, object):
     def reciprocal_vects(self) -> np.ndarray:
         """
         numpy.ndarray : Array of the crystallographic reciprocal box vectors.
-        These have not been scaled by the factor of 2 pi.
+        These have not been scaled by the factor of 2 pi.  The returned
+        array is computed once per change of vects and is read-only.
         """
         if self.__reciprocal_vects is None:
-            self.__reciprocal_vects = np.linalg.inv(self.vects).T
+            
+            # Closed-form 3x3 inverse: rows are b x c, c x a, a x b over the volume
+            (ax, ay, az), (bx, by, bz), (cx, cy, cz) = self.__vects.tolist()
+            recip = np.array([[by*cz - bz*cy, bz*cx - bx*cz, bx*cy - by*cx],
+                              [cy*az - cz*ay, cz*ax - cx*az, cx*ay - cy*ax],
+                              [ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bx]])
+            volume = ax*recip[0,0] + ay*recip[0,1] + az*recip[0,2]
+            if volume == 0.0:
+                raise np.linalg.LinAlgError('Singular box vectors')
+            recip /= volume
+            
+            # Cached array is shared with callers so protect it from changes
+            recip.flags.writeable = False
+            self.__reciprocal_vects = recip
         
         return self.__reciprocal_vects
 
     @property
     def origin(self) -> np.ndarray:
         """numpy.ndarray : Box origin position where vects are added to define the box.  Can be set directly."""
-        return deepcopy(self.__origin)
+        return self.__origin.copy()
 
     @origin.setter
     def origin(self, value: npt.ArrayLike):
@@ -799,8 +828,10 @@ class Box(Shape, object):
         if relpos.shape[-1] != 3:
             raise ValueError('Invalid position dimensions')
 
-        # Convert and return
-        return relpos.dot(self.vects) + self.origin
+        # Convert, shift in place and return
+        cartpos = relpos.dot(self.__vects)
+        cartpos += self.__origin
+        return cartpos
 
     def position_cartesian_to_relative(self, cartpos: npt.ArrayLike) -> np.ndarray:
         """
@@ -825,11 +856,14 @@ class Box(Shape, object):
         """
         # Check/convert cartpos
         value = np.asarray(cartpos, dtype=float)
-        if cartpos.shape[-1] != 3:
+        if value.shape[-1] != 3:
             raise ValueError('Invalid position dimensions')
 
-        # Convert and return
-        return np.inner((value - self.origin), self.reciprocal_vects)
+        # Convert with the cached inverse, then shift by the scaled origin
+        inverse = self.reciprocal_vects.T
+        relpos = value.dot(inverse)
+        relpos -= self.__origin.dot(inverse)
+        return relpos
 
     def iscubic(self, 
                 rtol: float = 1e-05,
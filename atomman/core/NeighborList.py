@@ -37,6 +37,10 @@ class NeighborList(object):
             Specifies the number of extra neighbor positions to allow each atom
             when the number of neighbors exceeds the underlying array size.
             Default value is 10.
+        skin : float, optional
+            Extra distance added to cutoff when building the list.  A
+            non-zero skin allows update() to reuse the list until an atom
+            moves more than skin/2.  Default value is 0.0.
         """
         if 'model' in kwargs:
             model = kwargs.pop('model')
@@ -56,6 +60,37 @@ class NeighborList(object):
         """numpy.ndarray: The underlying numpy array of coord + neighbor ids"""
         return self.__nlist
     
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        numpy.ndarray: Compressed sparse row offsets of the neighbor list.
+        The neighbors of atom i are indices[offsets[i]:offsets[i+1]].
+        """
+        if self.__offsets is None:
+            self.__build_csr()
+        return self.__offsets
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        numpy.ndarray: Compressed sparse row neighbor ids, i.e. the neighbors
+        of all atoms packed into a single contiguous array.
+        """
+        if self.__indices is None:
+            self.__build_csr()
+        return self.__indices
+
+    def __build_csr(self):
+        """Packs the neighbor array into compressed sparse row arrays."""
+        # Offsets are the running sum of the coordination numbers
+        offsets = np.zeros(len(self.__coord) + 1, dtype=self.__nlist.dtype)
+        np.cumsum(self.__coord, out=offsets[1:])
+
+        # Row-major masking keeps the neighbors of each atom in order
+        mask = np.arange(self.__neighbors.shape[1]) < self.__coord[:, np.newaxis]
+        self.__indices = self.__neighbors[mask]
+        self.__offsets = offsets
+
     def __len__(self) -> int:
         """len returns the number of atoms"""
         return len(self.__coord)
@@ -68,9 +103,11 @@ class NeighborList(object):
               system,
               cutoff: float,
               initialsize: int = 20,
-              deltasize: int = 10):
+              deltasize: int = 10,
+              skin: float = 0.0):
         """
-        Builds the neighbor list for a system.
+        Builds the neighbor list for a system.  All atoms within cutoff + skin
+        of each other are listed as neighbors.
         
         Parameters
         ----------
@@ -85,15 +122,71 @@ class NeighborList(object):
             Specifies the number of extra neighbor positions to allow each atom
             when the number of neighbors exceeds the underlying array size.
             Default value is 10.
+        skin : float, optional
+            Extra distance added to cutoff when building the list.  A
+            non-zero skin allows update() to reuse the list until an atom
+            moves more than skin/2.  Default value is 0.0.
         """
         # Call nlist
-        self.__nlist = nlist(system, cutoff, initialsize=initialsize, 
+        self.__nlist = nlist(system, cutoff + skin, initialsize=initialsize, 
                              deltasize=deltasize)
         
+        # Save build parameters and reference configuration for update()
+        self.__cutoff = cutoff
+        self.__skin = skin
+        self.__deltasize = deltasize
+        self.__refpos = system.atoms.pos.copy()
+        self.__refvects = system.box.vects
+        self.__reforigin = system.box.origin
+        self.__refpbc = system.pbc.copy()
+        
         # Split coord and neighbors
         self.__coord = self.__nlist[:, 0]
         self.__neighbors = self.__nlist[:, 1:]
+        self.__offsets = None
+        self.__indices = None
         
+    def update(self, system) -> bool:
+        """
+        Rebuilds the neighbor list for a system only if it is needed.  The
+        current list is kept if the box and pbc are unchanged and no atom has
+        moved more than skin/2 since the list was last built.
+        
+        Parameters
+        ----------
+        system : atomman.System 
+            The system to update the neighbor list for.
+        
+        Returns
+        -------
+        bool
+            True if the neighbor list was rebuilt, False otherwise.
+
+        Raises
+        ------
+        ValueError
+            If the neighbor list was loaded from a file rather than built.
+        """
+        if self.__refpos is None:
+            raise ValueError('Loaded neighbor lists cannot be updated')
+
+        pos = system.atoms.pos
+        if (pos.shape == self.__refpos.shape
+            and np.array_equal(system.box.vects, self.__refvects)
+            and np.array_equal(system.box.origin, self.__reforigin)
+            and np.array_equal(system.pbc, self.__refpbc)):
+            
+            # Check the largest displacement against half the skin
+            disp = pos - self.__refpos
+            if len(disp) == 0 or np.einsum('ij,ij->i', disp, disp).max() <= (self.__skin / 2)**2:
+                return False
+        
+        # Use the largest current coordination as the initial size guess
+        initialsize = max(20, int(self.coord.max(initial=0)))
+        self.build(system, self.__cutoff, initialsize=initialsize,
+                   deltasize=self.__deltasize, skin=self.__skin)
+        return True
+
     def load(self, model: Union[str, io.IOBase]):
         """
         Read in a neighbor list from a file.
@@ -119,6 +212,9 @@ class NeighborList(object):
             self.__nlist = np.empty((natoms, nterms+1), dtype=int)
             self.__coord = self.__nlist[:, 0]
             self.__neighbors = self.__nlist[:, 1:]
+            self.__offsets = None
+            self.__indices = None
+            self.__refpos = None
             
             # Second pass gets values
             self.__coord[:] = 0
@@ -145,8 +241,10 @@ class NeighborList(object):
             fp.write('# Neighbor list:\n')
             fp.write('# The first column gives an atom index.\n')
             fp.write('# The rest of the columns are the indexes of the identified neighbors.\n')
+            offsets = self.offsets
+            indices = self.indices
             for i in range(len(self)):
                 fp.write('%i' % i)
-                for j in self[i]:
+                for j in indices[offsets[i]:offsets[i+1]]:
                     fp.write(' %i' % j)
                 fp.write('\n')
\ No newline at end of file
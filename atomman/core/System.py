@@ -3,9 +3,10 @@
 from __future__ import annotations
 import io
 from collections import OrderedDict
+from contextlib import contextmanager
 from copy import deepcopy
 import warnings
-from typing import Any, Optional, Union, Tuple
+from typing import Any, Generator, Optional, Union, Tuple
 
 # http://www.numpy.org/
 import numpy as np
@@ -189,6 +190,25 @@ class System(object):
         # Set atoms indexer
         self.__atoms_ix = System._AtomsIndexer(self)
     
+    def __deepcopy__(self, memo) -> System:
+        """Copies the underlying objects directly rather than by reflection"""
+        newsystem = type(self).__new__(type(self))
+        memo[id(self)] = newsystem
+        newsystem.__atoms = deepcopy(self.__atoms, memo)
+        newsystem.__box = deepcopy(self.__box, memo)
+        newsystem.__pbc = self.__pbc.copy()
+        newsystem.__transformation = self.__transformation.copy()
+        newsystem.__symbols = self.__symbols
+        newsystem.__masses = self.__masses
+        newsystem.__atoms_ix = System._AtomsIndexer(newsystem)
+
+        # Copy any user-defined attributes
+        for key, value in self.__dict__.items():
+            if key not in newsystem.__dict__:
+                newsystem.__dict__[key] = deepcopy(value, memo)
+        
+        return newsystem
+
     def __str__(self) -> str:
         """str : The string representation of a system."""
         return '\n'.join([str(self.box),
@@ -242,7 +262,8 @@ class System(object):
         
     @pbc.setter
     def pbc(self, value: npt.ArrayLike):
-        pbc = np.asarray(value, dtype=bool)
+        # Copy so that in-place changes are not shared with other systems
+        pbc = np.array(value, dtype=bool)
         assert pbc.shape == (3,), 'invalid pbc entry' 
         self.__pbc = pbc
     
@@ -582,14 +603,44 @@ class System(object):
         
         # Hold scaled positions constant
         if scale is True:
-            spos = self.atoms_prop('pos', scale=True)
+            vects = self.box.vects
+            origin = self.box.origin
+            inverse = self.box.reciprocal_vects.T
             self.box.set(**kwargs)
-            self.atoms_prop('pos', value=spos, scale=True)
+            
+            # Nothing to do if the box did not change
+            if (np.array_equal(vects, self.box.vects)
+                and np.array_equal(origin, self.box.origin)):
+                return
+            
+            # Map old Cartesian positions to new ones with a single transform
+            transform = inverse.dot(self.box.vects)
+            pos = self.atoms.view['pos'] - origin
+            self.atoms.view['pos'] = pos.dot(transform) + self.box.origin
         
         # Call box.set without scaling
         else:
             self.box.set(**kwargs)
     
+    @contextmanager
+    def scaled_positions(self) -> Generator[np.ndarray, None, None]:
+        """
+        Context manager that holds the box-relative atomic positions constant
+        for any number of box changes.  The positions are scaled once on entry
+        and unscaled once using the final box on exit, so box_set() can be
+        called with scale=False inside the block.  If the block raises an
+        exception, the atomic positions are left unchanged.
+        
+        Yields
+        ------
+        numpy.ndarray
+            The scaled (box-relative) atomic positions.  Changes made to this
+            array are also applied to the atoms on exit.
+        """
+        spos = self.box.position_cartesian_to_relative(self.atoms.view['pos'])
+        yield spos
+        self.atoms.view['pos'] = self.box.position_relative_to_cartesian(spos)
+
     def scale(self, value: npt.ArrayLike) -> np.ndarray:
         """
         Scales 3D vectors from absolute Cartesian coordinates to relative box
@@ -669,48 +720,59 @@ class System(object):
             The imageflags array - only returned if return_imageflags = True.
         """
         
-        # mins and maxs are box dimensions relative to box vectors, i.e 0 to 1
-        mins = np.array([0.0, 0.0, 0.0])
-        maxs = np.array([1.0, 1.0, 1.0])
-        
         # Retrieve scaled pos
         spos = self.atoms_prop('pos', scale=True)
 
-        # Initialize wrapflags
-        imageflags = np.zeros_like(spos, dtype=int)
+        # Count wraps across periodic boundaries for all directions at once
+        imageflags = np.floor(spos)
+        imageflags *= self.pbc
         
-        # Loop over three pbc directions
-        for i in range(3):
-            
-            # Count wraps across periodic boundaries
-            if self.pbc[i]:
-                imageflags[:, i] = np.floor(spos[:, i]) # pylint: disable=unsupported-assignment-operation
-            
-            # Shift min and max to encompass atoms across non-periodic bounds
-            else:
-                min = spos[:, i].min()
-                max = spos[:, i].max()
-                if min <= mins[i]: 
-                    mins[i] = min - 0.001
-                if max >= maxs[i]: 
-                    maxs[i] = max + 0.001
-            
         # Wrap atoms across periodic boundaries
         spos -= imageflags
+        imageflags = imageflags.astype(int)
         
         # Unscale spos and save to pos
         self.atoms_prop('pos', value=spos, scale=True)
         
-        # Modify box vectors and origin by new min and max
-        origin = self.box.origin + mins.dot(self.box.vects) 
-        avect = self.box.avect * (maxs[0] - mins[0])
-        bvect = self.box.bvect * (maxs[1] - mins[1])
-        cvect = self.box.cvect * (maxs[2] - mins[2])
-        self.box_set(avect=avect, bvect=bvect, cvect=cvect, origin=origin)
+        # Shift min and max to encompass atoms across non-periodic bounds
+        nonperiodic = ~self.pbc
+        if np.any(nonperiodic):
+            
+            # mins and maxs are box dimensions relative to box vectors, i.e 0 to 1
+            smin = spos.min(axis=0)
+            smax = spos.max(axis=0)
+            mins = np.where(nonperiodic & (smin <= 0.0), smin - 0.001, 0.0)
+            maxs = np.where(nonperiodic & (smax >= 1.0), smax + 0.001, 1.0)
+            
+            # Modify box vectors and origin by new min and max
+            vects = self.box.vects
+            origin = self.box.origin + mins.dot(vects)
+            vects *= (maxs - mins)[:, np.newaxis]
+            self.box_set(vects=vects, origin=origin)
 
         if return_imageflags:
             return imageflags
     
+    def __pos(self, value: Union[int, list, slice, npt.ArrayLike]) -> np.ndarray:
+        """
+        Returns self.atoms.pos[value] if value can be used as an index, or
+        value as an array of positions otherwise.
+        """
+        # Float arrays are always positions: skip the failed index attempt
+        if isinstance(value, np.ndarray) and value.dtype.kind == 'f':
+            return value
+        
+        # Index in-bounds forward ranges as slices to get a view rather than a copy
+        if (isinstance(value, range) and value.step > 0 and value.start >= 0
+            and 0 <= value.stop <= self.natoms):
+            value = slice(value.start, value.stop, value.step)
+        
+        # Test if value can be used as a numpy array index
+        try:
+            return self.atoms.pos[value]
+        except:
+            return np.asarray(value)
+
     def dvect(self,
               pos_0: Union[int, list, slice, npt.ArrayLike],
               pos_1: Union[int, list, slice, npt.ArrayLike]
@@ -735,15 +797,9 @@ class System(object):
         numpy.ndarray
             The shortest vectors from each pos_0 to pos_1 positions.
         """
-        # Test if pos_0 and pos_1 can be used as numpy array indices
-        try:
-            pos_0 = self.atoms.pos[pos_0]
-        except:
-            pos_0 = np.asarray(pos_0)
-        try:
-            pos_1 = self.atoms.pos[pos_1]
-        except:
-            pos_1 = np.asarray(pos_1)
+        # Get positions from atom indices or given values
+        pos_0 = self.__pos(pos_0)
+        pos_1 = self.__pos(pos_1)
         
         # Call dvect using self's box and pbc
         vects = dvect(pos_0, pos_1, self.box, self.pbc)
@@ -776,15 +832,9 @@ class System(object):
         numpy.ndarray
             The shortest vector magnitude from each pos_0 to pos_1 positions.
         """
-        # Test if pos_0 and pos_1 can be used as numpy array indices
-        try:
-            pos_0 = self.atoms.pos[pos_0]
-        except:
-            pos_0 = np.asarray(pos_0)
-        try:
-            pos_1 = self.atoms.pos[pos_1]
-        except:
-            pos_1 = np.asarray(pos_1)
+        # Get positions from atom indices or given values
+        pos_0 = self.__pos(pos_0)
+        pos_1 = self.__pos(pos_1)
         
         # Call dvect using self's box and pbc
         vects = dmag(pos_0, pos_1, self.box, self.pbc)
@@ -793,6 +843,42 @@ class System(object):
         else:
             return vects
     
+    def all_dvects(self, pos: Optional[npt.ArrayLike] = None) -> np.ndarray:
+        """
+        Computes the shortest vectors between all pairs of positions using box
+        dimensions and accounting for periodic boundaries.
+        
+        Parameters
+        ----------
+        pos : array-like object, optional
+            (N, 3) array of absolute Cartesian positions.  Default value is
+            self.atoms.pos.
+        
+        Returns
+        -------
+        numpy.ndarray
+            (N, N, 3) array where [i, j] is the shortest vector from pos[i]
+            to pos[j].
+        """
+        if pos is None:
+            pos = self.atoms.pos
+        pos = np.asarray(pos, dtype=float)
+        if pos.ndim != 2 or pos.shape[1] != 3:
+            raise ValueError('Invalid position dimensions')
+        n = len(pos)
+        
+        # Pair blocks of rows with all positions to bound the temporary arrays
+        vects = np.empty((n, n, 3))
+        blocksize = max(1, 65536 // max(n, 1))
+        for start in range(0, n, blocksize):
+            rows = pos[start:start + blocksize]
+            pos_0 = np.repeat(rows, n, axis=0)
+            pos_1 = np.tile(pos, (len(rows), 1))
+            vects[start:start + len(rows)] = dvect(pos_0, pos_1, self.box,
+                                                   self.pbc).reshape(len(rows), n, 3)
+        
+        return vects
+    
     def neighborlist(self, **kwargs) -> NeighborList:
         """
         Builds a neighbor list for the system.  The resulting NeighborList
@@ -813,6 +899,10 @@ class System(object):
             Specifies the number of extra neighbor positions to allow each atom
             when the number of neighbors exceeds the underlying array size.
             Default value is 10.
+        skin : float, optional
+            Extra distance added to cutoff when building the list.  A
+            non-zero skin allows NeighborList.update() to reuse the list until
+            an atom moves more than skin/2.  Default value is 0.0.
             
         Returns
         -------
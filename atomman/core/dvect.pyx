@@ -7,6 +7,7 @@ from copy import deepcopy
 
 # http://cython.org/
 import cython
+from libc.math cimport rint
 
 # http://www.numpy.org/
 import numpy as np
@@ -99,15 +100,44 @@ cdef dvect_c(const double[:,:] pos_0,
     
     # Define parameters
     cdef Py_ssize_t ni = pos_0.shape[0]
-    cdef int nj = 3
-    cdef int i, j, x, y, z, xl, xh, yl, yh, zl, zh    
-    cdef double[:] test = np.empty(3)
+    cdef Py_ssize_t i, j
+    cdef int x, y, z, xl, xh, yl, yh, zl, zh, s
+    cdef int nshifts = 0
+    cdef double shifts[26][3]
+    cdef double dx, dy, dz, tx, ty, tz, bx, by, bz
     cdef double mag_test, mag_d
+    cdef double lx, ly, lz
+    cdef double fx, fy, fz
+    cdef double r[3][3]
+    cdef double volume
     
     # Define output array and its view
-    d = np.empty_like(pos_0, np.float64)
+    d = np.empty((ni, 3), dtype=np.float64)
     cdef double[:,:] dv = d
     
+    # Orthogonal boxes: shift each periodic component to its nearest image
+    if (bvects[0,1] == 0.0 and bvects[0,2] == 0.0 and bvects[1,0] == 0.0
+        and bvects[1,2] == 0.0 and bvects[2,0] == 0.0 and bvects[2,1] == 0.0):
+        lx = bvects[0,0]
+        ly = bvects[1,1]
+        lz = bvects[2,2]
+        with nogil:
+            for i in range(ni):
+                dx = pos_1[i,0] - pos_0[i,0]
+                dy = pos_1[i,1] - pos_0[i,1]
+                dz = pos_1[i,2] - pos_0[i,2]
+                if pbc_x:
+                    dx -= lx * rint(dx / lx)
+                if pbc_y:
+                    dy -= ly * rint(dy / ly)
+                if pbc_z:
+                    dz -= lz * rint(dz / lz)
+                dv[i,0] = dx
+                dv[i,1] = dy
+                dv[i,2] = dz
+
+        return d
+
     # Create iterators based on pbc
     if pbc_x:
         xl, xh = -1, 2
@@ -122,32 +152,75 @@ cdef dvect_c(const double[:,:] pos_0,
     else:
         zl, zh = 0, 1
     
-    # Loop over all pos
-    for i in range(ni):
-       
-        # Compute pos_1 - pos_0 
-        for j in range(nj):
-            dv[i,j] = pos_1[i,j] - pos_0[i,j]
+    # Reciprocal box vectors for converting to box-relative coordinates:
+    # closed-form rows b x c, c x a, a x b over the volume
+    for j in range(3):
+        r[0][j] = (bvects[1,(j+1)%3] * bvects[2,(j+2)%3]
+                   - bvects[1,(j+2)%3] * bvects[2,(j+1)%3])
+        r[1][j] = (bvects[2,(j+1)%3] * bvects[0,(j+2)%3]
+                   - bvects[2,(j+2)%3] * bvects[0,(j+1)%3])
+        r[2][j] = (bvects[0,(j+1)%3] * bvects[1,(j+2)%3]
+                   - bvects[0,(j+2)%3] * bvects[1,(j+1)%3])
+    volume = bvects[0,0] * r[0][0] + bvects[0,1] * r[0][1] + bvects[0,2] * r[0][2]
+    if volume == 0.0:
+        raise np.linalg.LinAlgError('Singular box vectors')
+    for j in range(3):
+        r[0][j] /= volume
+        r[1][j] /= volume
+        r[2][j] /= volume
+
+    # Tabulate the boundary image shifts once
+    for x in range(xl, xh):
+        for y in range(yl, yh):
+            for z in range(zl, zh):
+                if x == 0 and y == 0 and z == 0:
+                    continue
+                for j in range(3):
+                    shifts[nshifts][j] = (x * bvects[0,j] 
+                                          + y * bvects[1,j] 
+                                          + z * bvects[2,j])
+                nshifts += 1
+    
+    with nogil:
         
-        # Loop over all periodic boundary conditions
-        for x in range(xl, xh):
-            for y in range(yl, yh):
-                for z in range(zl, zh):
-                    if x == 0 and y == 0 and z == 0:
-                        continue
-                    
-                    # Compute pos_1 - pos_0 + boundary image shifts
-                    for j in range(nj):
-                        test[j] = (pos_1[i,j] - pos_0[i,j] 
-                                   + x * bvects[0,j] 
-                                   + y * bvects[1,j] 
-                                   + z * bvects[2,j])
-                    
-                    # Replace d if new vector is smaller
-                    mag_test = test[0] * test[0] + test[1] * test[1] + test[2] * test[2]
-                    mag_d = dv[i,0] * dv[i,0] + dv[i,1] * dv[i,1] + dv[i,2] * dv[i,2]
-                    if mag_test < mag_d:
-                        for j in range(nj):
-                            dv[i,j] = test[j]
+        # Loop over all pos
+        for i in range(ni):
+            
+            # Compute pos_1 - pos_0 
+            dx = pos_1[i,0] - pos_0[i,0]
+            dy = pos_1[i,1] - pos_0[i,1]
+            dz = pos_1[i,2] - pos_0[i,2]
+
+            # Wrap periodic relative components to the central image
+            fx = dx * r[0][0] + dy * r[0][1] + dz * r[0][2]
+            fy = dx * r[1][0] + dy * r[1][1] + dz * r[1][2]
+            fz = dx * r[2][0] + dy * r[2][1] + dz * r[2][2]
+            if pbc_x:
+                fx -= rint(fx)
+            if pbc_y:
+                fy -= rint(fy)
+            if pbc_z:
+                fz -= rint(fz)
+            dx = fx * bvects[0,0] + fy * bvects[1,0] + fz * bvects[2,0]
+            dy = fx * bvects[0,1] + fy * bvects[1,1] + fz * bvects[2,1]
+            dz = fx * bvects[0,2] + fy * bvects[1,2] + fz * bvects[2,2]
+            bx, by, bz = dx, dy, dz
+            mag_d = dx * dx + dy * dy + dz * dz
+            
+            # Loop over all periodic boundary images
+            for s in range(nshifts):
+                tx = dx + shifts[s][0]
+                ty = dy + shifts[s][1]
+                tz = dz + shifts[s][2]
+                
+                # Replace d if new vector is smaller
+                mag_test = tx * tx + ty * ty + tz * tz
+                if mag_test < mag_d:
+                    mag_d = mag_test
+                    bx, by, bz = tx, ty, tz
+            
+            dv[i,0] = bx
+            dv[i,1] = by
+            dv[i,2] = bz
 
     return d
\ No newline at end of file
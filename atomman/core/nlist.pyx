@@ -39,8 +39,8 @@ def nlist(system, double cutoff, Py_ssize_t initialsize=20, Py_ssize_t deltasize
         The next c values are the atom's neighbor ids.  
     """
     
-    # Define variables based on input parameters
-    pos = system.atoms.pos
+    # Define variables based on input parameters (pos may be stored as float32)
+    pos = np.asarray(system.atoms.pos, dtype=np.float64)
     cdef const double[:,:] posv = pos
     cdef const double[:,:] vects = system.box.vects
     cdef const double[:] origin = system.box.origin
@@ -75,13 +75,8 @@ def nlist(system, double cutoff, Py_ssize_t initialsize=20, Py_ssize_t deltasize
     
     # Define ghost atom info
     cdef Py_ssize_t xl, xh, yl, yh, zl, zh
-    cdef double[:,:] ghostpos = np.empty((0, 3))
-    cdef double[:,:] newghostpos
-    newpos = np.empty(pos.shape)
-    cdef double[:,:] newposv = newpos
-    cdef long long[:] ghostindex = np.empty(0, dtype=np.int64)
-    cdef long long[:] newindex = np.empty(posv.shape[0], dtype=np.int64)
-    cdef long long[:] newghostindex 
+    ghostposlist = []
+    ghostindexlist = []
     cdef long long [:,:] xyzghostindex
     
     # Define final bins
@@ -95,6 +90,7 @@ def nlist(system, double cutoff, Py_ssize_t initialsize=20, Py_ssize_t deltasize
     cdef bint end
     
     # Define positions and distances between them
+    cdef Py_ssize_t nv
     cdef double[:,:] upos, vpos
     cdef double[:] dmag2
     
@@ -165,20 +161,23 @@ def nlist(system, double cutoff, Py_ssize_t initialsize=20, Py_ssize_t deltasize
                 if x == 0 and y == 0 and z == 0:
                     pass
                 else:
-                    k=0
-                    for i in range(posv.shape[0]):
-                        for j in range(3):
-                            newposv[i, j] = x * vects[0, j] + y * vects[1, j] + z * vects[2, j] + posv[i, j]
-
-                        if (    newposv[i, 0] > supermin[0] and newposv[i, 0] < supermax[0]
-                            and newposv[i, 1] > supermin[1] and newposv[i, 1] < supermax[1]
-                            and newposv[i, 2] > supermin[2] and newposv[i, 2] < supermax[2]):
-                            
-                            newindex[k] = i
-                            k += 1
+                    newpos = pos + (x * np.asarray(vects[0]) 
+                                    + y * np.asarray(vects[1])
+                                    + z * np.asarray(vects[2]))
+                    newindex = np.flatnonzero(np.all((newpos > np.asarray(supermin))
+                                                     & (newpos < np.asarray(supermax)), axis=1))
+                    
+                    # Collect ghosts and join them once after the loop
+                    ghostposlist.append(newpos[newindex])
+                    ghostindexlist.append(newindex)
 
-                    ghostpos = np.vstack((ghostpos, newpos[newindex[:k]]))
-                    ghostindex = np.hstack((ghostindex, newindex[:k]))
+    # Join ghost atoms found in all images
+    if len(ghostposlist) > 0:
+        ghostpos = np.concatenate(ghostposlist)
+        ghostindex = np.concatenate(ghostindexlist).astype(np.int64)
+    else:
+        ghostpos = np.empty((0, 3))
+        ghostindex = np.empty(0, dtype=np.int64)
 
     # Append xyzindex and atomindex lists with ghost atoms
     if len(ghostpos) > 0:
@@ -215,6 +214,10 @@ def nlist(system, double cutoff, Py_ssize_t initialsize=20, Py_ssize_t deltasize
         xyzbins[x, y, z, c] = atomindex[n]
 
     superlonglist = np.empty(14 * maxc, dtype=np.int64)
+    
+    # Allocate position work arrays once for the largest possible comparison
+    upos = np.empty((14 * maxc, 3))
+    vpos = np.empty((14 * maxc, 3))
 
     # Iterate over all bins with real atoms
     for i in range(len(realbins)):
@@ -259,20 +262,20 @@ def nlist(system, double cutoff, Py_ssize_t initialsize=20, Py_ssize_t deltasize
         for u in range(shortlist.shape[0]):
             uindex = shortlist[u]
             
-            upos = np.empty((longlist.shape[0]-u-1, 3))
-            vpos = np.empty((longlist.shape[0]-u-1, 3))
-
-            for w, v in enumerate(range(u+1, longlist.shape[0])):
+            nv = longlist.shape[0] - u - 1
+            for v in range(u+1, longlist.shape[0]):
+                w = v - u - 1
+                vindex = longlist[v]
                 for j in range(3):
-                    vindex = longlist[v]
                     upos[w, j] = posv[uindex, j]
                     vpos[w, j] = posv[vindex, j]
             
             # Compute distances
-            dmag2 = dmag2_c(upos, vpos, vects, pbc_a, pbc_b, pbc_c)
+            dmag2 = dmag2_c(upos[:nv], vpos[:nv], vects, pbc_a, pbc_b, pbc_c)
             
             # Assign neighbors if within cutoff
-            for w, v in enumerate(range(u+1, longlist.shape[0])):
+            for v in range(u+1, longlist.shape[0]):
+                w = v - u - 1
                 if dmag2[w] < cutoff2:
                     vindex = longlist[v]
             
@@ -2,7 +2,15 @@
 
 # Standard Python imports
 import io
-from typing import Optional, Union, Tuple
+from functools import cached_property
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional, Union, Tuple
+
+# http://www.numpy.org/
+import numpy as np
+
+# https://pandas.pydata.org/
+import pandas as pd
 
 # https://github.com/usnistgov/DataModelDict
 from DataModelDict import DataModelDict as DM
@@ -15,6 +23,108 @@ from yabadaba import load_query
 import atomman.unitconvert as uc
 from ... import System
 
+# Attributes included in RelaxedCrystal.metadata after name
+_METADATA_FIELDS = (
+    'key', 'url', 'method', 'standing', 'family', 'parent_key',
+    'potential_LAMMPS_id', 'potential_LAMMPS_key', 'potential_id', 'potential_key',
+    'temperature',
+    #'pressure_xx', 'pressure_yy', 'pressure_zz',
+    #'pressure_xy', 'pressure_xz', 'pressure_yz',
+    'crystalfamily', 'natypes', 'symbols', 'composition',
+    'a', 'b', 'c', 'alpha', 'beta', 'gamma', 'natoms',
+    'potential_energy', 'cohesive_energy')
+_get_metadata = attrgetter(*_METADATA_FIELDS)
+
+# Fixed dtypes for the numeric metadata columns
+_METADATA_DTYPES = {
+    'temperature': float,
+    'natypes': int,
+    'a': float, 'b': float, 'c': float,
+    'alpha': float, 'beta': float, 'gamma': float,
+    'natoms': int,
+    'potential_energy': float, 'cohesive_energy': float}
+
+# Marks _ModelAttr values that must be in the model
+_REQUIRED = object()
+
+class _ModelAttr():
+    """
+    Descriptor for the read-only RelaxedCrystal attributes that are read
+    from the loaded model.  The value is looked up the first time the
+    attribute is accessed and cached in the instance's _modelvalues dict, so
+    fields that are never accessed are never parsed or unit converted.
+    """
+    def __init__(self,
+                 path: str,
+                 doc: Optional[str] = None,
+                 default: Any = _REQUIRED,
+                 aslist: bool = False,
+                 parse: Optional[Callable] = None):
+        """
+        Parameters
+        ----------
+        path : str
+            The period-delimited path to the value in the crystal element
+            of the model.
+        doc : str, optional
+            The docstring to show for the attribute.
+        default : any, optional
+            The value to use if path is not in the model.  If not given, a
+            missing element raises a KeyError.
+        aslist : bool, optional
+            If True, the final element is retrieved as a list.
+        parse : callable, optional
+            A function to apply to the element found in the model, such as
+            atomman.unitconvert.value_unit.  Not applied to default.
+        """
+        self.path = tuple(path.split('.'))
+        self.default = default
+        self.aslist = aslist
+        self.parse = parse
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        # Bypass Record.__getattribute__ to get the instance dict
+        attrs = object.__getattribute__(obj, '__dict__')
+        try:
+            return attrs['_modelvalues'][self.name]
+        except KeyError:
+            pass
+        crystal = attrs.get('_crystal', None)
+        if crystal is None:
+            raise AttributeError('No model information loaded')
+
+        # Retrieve the value from the model
+        try:
+            for key in self.path[:-1]:
+                crystal = crystal[key]
+            if self.aslist:
+                value = crystal.aslist(self.path[-1])
+            else:
+                value = crystal[self.path[-1]]
+        except KeyError:
+            if self.default is _REQUIRED:
+                raise
+            value = self.default
+        else:
+            if self.parse is not None:
+                value = self.parse(value)
+
+        attrs['_modelvalues'][self.name] = value
+        return value
+
+    def __set__(self, obj, value):
+        raise AttributeError(f"can't set attribute '{self.name}'")
+
+    def __delete__(self, obj):
+        raise AttributeError(f"can't delete attribute '{self.name}'")
+
 class RelaxedCrystal(Record):
     """
     Class for representing relaxed_crystal records that provide the structure
@@ -39,7 +149,7 @@ class RelaxedCrystal(Record):
         database : yabadaba.Database, optional
             Allows for a default database to be associated with the record.
         """
-        self.__ucell = None
+        self.__metadata = None
         super().__init__(model=model, name=name, database=database)
 
     @property
@@ -66,7 +176,11 @@ class RelaxedCrystal(Record):
                    model: Union[str, io.IOBase, DM],
                    name: Optional[str] = None):
         """
-        Loads record contents from a given model.
+        Loads record contents from a given model.  The model-derived
+        attributes are only parsed when first accessed, so a required element
+        missing from the model raises a KeyError when its attribute is
+        accessed rather than when the model is loaded.  Only key is accessed
+        during loading, and only if name is not given.
 
         Parameters
         ----------
@@ -75,328 +189,119 @@ class RelaxedCrystal(Record):
         name : str, optional
             The name to assign to the record.  Often inferred from other
             attributes if not given.
+
+        Raises
+        ------
+        KeyError
+            If name is not given and the model has no key element.
         """
         super().load_model(model, name=name)
         crystal = self.model[self.modelroot]
-        
-        self.__key = crystal['key']
-        self.__url = crystal.get('URL', None)
-        self.__method = crystal['method']
-        self.__standing = crystal['standing']
 
-        self.__potential_LAMMPS_id = crystal['potential-LAMMPS']['id']
-        self.__potential_LAMMPS_key = crystal['potential-LAMMPS']['key']
-        self.__potential_LAMMPS_url = crystal['potential-LAMMPS'].get('URL', None)
+        # Clear values cached from any previous model
+        attrs = self.__dict__
+        attrs.pop('ucell', None)
+        self.__metadata = None
 
-        self.__potential_id = crystal['potential-LAMMPS']['potential']['id']
-        self.__potential_key = crystal['potential-LAMMPS']['potential']['key']
-        self.__potential_url = crystal['potential-LAMMPS']['potential'].get('URL', None)
-
-        try:
-            self.__temperature = uc.value_unit(crystal['phase-state']['temperature'])
-        except KeyError:
-            self.__temperature = 0.0
-        try:
-            self.__pressure_xx = uc.value_unit(crystal['phase-state']['pressure-xx'])
-        except KeyError:
-            self.__pressure_xx = 0.0
-        try:
-            self.__pressure_yy = uc.value_unit(crystal['phase-state']['pressure-yy'])
-        except KeyError:
-            self.__pressure_yy = 0.0
-        try:
-            self.__pressure_zz = uc.value_unit(crystal['phase-state']['pressure-zz'])
-        except KeyError:
-            self.__pressure_zz = 0.0
-        try:
-            self.__pressure_xy = uc.value_unit(crystal['phase-state']['pressure-xy'])
-        except KeyError:
-            self.__pressure_xy = 0.0
-        try:
-            self.__pressure_xz = uc.value_unit(crystal['phase-state']['pressure-xz'])
-        except KeyError:
-            self.__pressure_xz = 0.0
-        try:
-            self.__pressure_yz = uc.value_unit(crystal['phase-state']['pressure-yz'])
-        except KeyError:
-            self.__pressure_yz = 0.0
-
-        self.__family = crystal['system-info']['family']
-        self.__family_url = crystal['system-info'].get('family-URL', None)
-
-        self.__parent_key = crystal['system-info']['parent_key']
-        self.__parent_url = crystal['system-info'].get('parent-URL', None)
-
-        self.__symbols = crystal['system-info'].aslist('symbol')
-        self.__composition = crystal['system-info']['composition']
-        self.__crystalfamily = crystal['system-info']['cell']['crystal-family']
-        self.__natypes = crystal['system-info']['cell']['natypes']
-        self.__a = crystal['system-info']['cell']['a']
-        self.__b = crystal['system-info']['cell']['b']
-        self.__c = crystal['system-info']['cell']['c']
-        self.__alpha = crystal['system-info']['cell']['alpha']
-        self.__beta = crystal['system-info']['cell']['beta']
-        self.__gamma = crystal['system-info']['cell']['gamma']
-        
-        self.__natoms = crystal['atomic-system']['atoms']['natoms']
-
-        self.__potential_energy = uc.value_unit(crystal['potential-energy'])
-        self.__cohesive_energy = uc.value_unit(crystal['cohesive-energy'])
-        
-        self.__ucell = None
+        # Values are parsed from the crystal element on first access
+        attrs['_crystal'] = crystal
+        attrs['_modelvalues'] = {}
 
         # Set name as key if no name given
-        try:
-            self.name
-        except AttributeError:
+        if not hasattr(self, 'name'):
             self.name = self.key
 
-    @property
-    def key(self) -> str:
-        """str : A UUID4 key assigned to the record"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__key
-
-    @property
-    def url(self) -> Optional[str]:
-        """str : A URL where a copy of the record can be found"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__url
-
-    @property
-    def method(self) -> str:
-        """str : Indicates the relaxation method used: box, static or dynamic"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__method
-    
-    @property
-    def standing(self) -> str:
-        """str : 'good' or 'bad', with bad indicating it to be a duplicate or transformation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__standing
-    
-    @property
-    def family(self) -> str:
-        """str : The associated prototype/reference crystal id that the relaxed crystal is based on"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__family
-
-    @property
-    def family_url(self) -> Optional[str]:
-        """str : A URL where a copy of the family record can be found"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__family_url
-
-    @property
-    def parent_key(self) -> str:
-        """str : The key assigned to the record of the relaxation calculation used"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__parent_key
-
-    @property
-    def parent_url(self) -> Optional[str]:
-        """str : A URL where a copy of the parent record can be found"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__parent_url
-
-    @property
-    def potential_LAMMPS_id(self) -> str:
-        """str : The id of the LAMMPS implementation used to relax the crystal"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__potential_LAMMPS_id
-
-    @property
-    def potential_LAMMPS_key(self) -> str:
-        """str : The key of the LAMMPS implementation used to relax the crystal"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__potential_LAMMPS_key
-
-    @property
-    def potential_LAMMPS_url(self) -> Optional[str]:
-        """str : A URL where a copy of the potential_LAMMPS record can be found"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__potential_LAMMPS_url
-
-    @property
-    def potential_id(self) -> str:
-        """str : The id of the potential model used to relax the crystal"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__potential_id
-
-    @property
-    def potential_key(self) -> str:
-        """str : The key of the potential model used to relax the crystal"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__potential_key
-
-    @property
-    def potential_url(self) -> Optional[str]:
-        """str : A URL where a copy of the potential model record can be found"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__potential_url
-
-    @property
-    def temperature(self) -> float:
-        """float : The target temperature used during relaxation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__temperature
-
-    @property
-    def pressure_xx(self) -> float:
-        """float : The target xx pressure component used during relaxation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__pressure_xx
-
-    @property
-    def pressure_yy(self) -> float:
-        """float : The target yy pressure component used during relaxation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__pressure_yy
-
-    @property
-    def pressure_zz(self) -> float:
-        """float : The target zz pressure component used during relaxation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__pressure_zz
-    
-    @property
-    def pressure_xy(self) -> float:
-        """float : The target xy pressure component used during relaxation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__pressure_xy
-    
-    @property
-    def pressure_xz(self) -> float:
-        """float : The target xz pressure component used during relaxation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__pressure_xz
-    
-    @property
-    def pressure_yz(self) -> float:
-        """float : The target yz pressure component used during relaxation"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__pressure_yz
-
-    @property
-    def cohesive_energy(self) -> float:
-        """float : The computed per-atom cohesive energy"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__cohesive_energy
-
-    @property
-    def potential_energy(self) -> float:
-        """float : The measured per-atom potential energy"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__potential_energy
-
-    @property
-    def composition(self) -> str:
-        """str : The crystal's composition"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__composition
-
-    @property
-    def symbols(self) -> list:
-        """list : The list of element model symbols"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__symbols
-
-    @property
-    def natoms(self) -> int:
-        """int : The number of atoms in the unit cell"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__natoms
-
-    @property
-    def natypes(self) -> int:
-        """int : The number of atom types in the unit cell"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__natypes
-
-    @property
-    def crystalfamily(self) -> str:
-        """str : The crystal's system family"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__crystalfamily
-
-    @property
-    def a(self) -> float:
-        """float : The unit cell's a lattice parameter"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__a
-
-    @property
-    def b(self) -> float:
-        """float : The unit cell's b lattice parameter"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__b
-
-    @property
-    def c(self) -> float:
-        """float : The unit cell's c lattice parameter"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__c
-
-    @property
-    def alpha(self) -> float:
-        """float : The unit cell's alpha lattice angle"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__alpha
-
-    @property
-    def beta(self) -> float:
-        """float : The unit cell's beta lattice angle"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__beta
-
-    @property
-    def gamma(self) -> float:
-        """float : The unit cell's gamma lattice angle"""
-        if self.model is None:
-            raise AttributeError('No model information loaded')
-        return self.__gamma
-
-    @property
+    # Model-derived attributes
+    key = _ModelAttr('key',
+                     "str : A UUID4 key assigned to the record")
+    url = _ModelAttr('URL',
+                     "str : A URL where a copy of the record can be found",
+                     default=None)
+    method = _ModelAttr('method',
+                        "str : Indicates the relaxation method used: box, static or dynamic")
+    standing = _ModelAttr('standing',
+                          "str : 'good' or 'bad', with bad indicating it to be a duplicate or transformation")
+    family = _ModelAttr('system-info.family',
+                        "str : The associated prototype/reference crystal id that the relaxed crystal is based on")
+    family_url = _ModelAttr('system-info.family-URL',
+                            "str : A URL where a copy of the family record can be found",
+                            default=None)
+    parent_key = _ModelAttr('system-info.parent_key',
+                            "str : The key assigned to the record of the relaxation calculation used")
+    parent_url = _ModelAttr('system-info.parent-URL',
+                            "str : A URL where a copy of the parent record can be found",
+                            default=None)
+    potential_LAMMPS_id = _ModelAttr('potential-LAMMPS.id',
+                                     "str : The id of the LAMMPS implementation used to relax the crystal")
+    potential_LAMMPS_key = _ModelAttr('potential-LAMMPS.key',
+                                      "str : The key of the LAMMPS implementation used to relax the crystal")
+    potential_LAMMPS_url = _ModelAttr('potential-LAMMPS.URL',
+                                      "str : A URL where a copy of the potential_LAMMPS record can be found",
+                                      default=None)
+    potential_id = _ModelAttr('potential-LAMMPS.potential.id',
+                              "str : The id of the potential model used to relax the crystal")
+    potential_key = _ModelAttr('potential-LAMMPS.potential.key',
+                               "str : The key of the potential model used to relax the crystal")
+    potential_url = _ModelAttr('potential-LAMMPS.potential.URL',
+                               "str : A URL where a copy of the potential model record can be found",
+                               default=None)
+    temperature = _ModelAttr('phase-state.temperature',
+                             "float : The target temperature used during relaxation",
+                             default=0.0, parse=uc.value_unit)
+    pressure_xx = _ModelAttr('phase-state.pressure-xx',
+                             "float : The target xx pressure component used during relaxation",
+                             default=0.0, parse=uc.value_unit)
+    pressure_yy = _ModelAttr('phase-state.pressure-yy',
+                             "float : The target yy pressure component used during relaxation",
+                             default=0.0, parse=uc.value_unit)
+    pressure_zz = _ModelAttr('phase-state.pressure-zz',
+                             "float : The target zz pressure component used during relaxation",
+                             default=0.0, parse=uc.value_unit)
+    pressure_xy = _ModelAttr('phase-state.pressure-xy',
+                             "float : The target xy pressure component used during relaxation",
+                             default=0.0, parse=uc.value_unit)
+    pressure_xz = _ModelAttr('phase-state.pressure-xz',
+                             "float : The target xz pressure component used during relaxation",
+                             default=0.0, parse=uc.value_unit)
+    pressure_yz = _ModelAttr('phase-state.pressure-yz',
+                             "float : The target yz pressure component used during relaxation",
+                             default=0.0, parse=uc.value_unit)
+    cohesive_energy = _ModelAttr('cohesive-energy',
+                                 "float : The computed per-atom cohesive energy",
+                                 parse=uc.value_unit)
+    potential_energy = _ModelAttr('potential-energy',
+                                  "float : The measured per-atom potential energy",
+                                  parse=uc.value_unit)
+    composition = _ModelAttr('system-info.composition',
+                             "str : The crystal's composition")
+    symbols = _ModelAttr('system-info.symbol',
+                         "list : The list of element model symbols",
+                         aslist=True)
+    natoms = _ModelAttr('atomic-system.atoms.natoms',
+                        "int : The number of atoms in the unit cell")
+    natypes = _ModelAttr('system-info.cell.natypes',
+                         "int : The number of atom types in the unit cell")
+    crystalfamily = _ModelAttr('system-info.cell.crystal-family',
+                               "str : The crystal's system family")
+    a = _ModelAttr('system-info.cell.a',
+                   "float : The unit cell's a lattice parameter")
+    b = _ModelAttr('system-info.cell.b',
+                   "float : The unit cell's b lattice parameter")
+    c = _ModelAttr('system-info.cell.c',
+                   "float : The unit cell's c lattice parameter")
+    alpha = _ModelAttr('system-info.cell.alpha',
+                       "float : The unit cell's alpha lattice angle")
+    beta = _ModelAttr('system-info.cell.beta',
+                      "float : The unit cell's beta lattice angle")
+    gamma = _ModelAttr('system-info.cell.gamma',
+                       "float : The unit cell's gamma lattice angle")
+
+    @cached_property
     def ucell(self) -> System:
         """atomman.System : The unit cell system for the crystal"""
         if self.model is None:
             raise AttributeError('No model information loaded')
-        if self.__ucell is None:
-            self.__ucell = System(model=self.model)
-        return self.__ucell
+        return System(model=self.model)
 
     def build_model(self) -> DM:
         if self.model is None:
@@ -409,49 +314,66 @@ class RelaxedCrystal(Record):
         Useful for quickly comparing records and for building pandas.DataFrames
         for multiple records of the same style.
         """
-        params = {}
-        params['name'] = self.name
-        params['key'] = self.key
-        params['url'] = self.url
-        params['method'] = self.method
-        params['standing'] = self.standing
-        params['family'] = self.family
-        params['parent_key'] = self.parent_key
-        
-        params['potential_LAMMPS_id'] = self.potential_LAMMPS_id
-        params['potential_LAMMPS_key'] = self.potential_LAMMPS_key
-        params['potential_id'] = self.potential_id
-        params['potential_key'] = self.potential_key
-        
-        params['temperature'] = self.temperature
-        #params['pressure_xx'] = self.pressure_xx
-        #params['pressure_yy'] = self.pressure_yy
-        #params['pressure_zz'] = self.pressure_zz
-        #params['pressure_xy'] = self.pressure_xy
-        #params['pressure_xz'] = self.pressure_xz
-        #params['pressure_yz'] = self.pressure_yz
-
-        params['crystalfamily'] = self.crystalfamily
-        params['natypes'] = self.natypes
-        params['symbols'] = self.symbols
-        params['composition'] = self.composition
-
-        params['a'] = self.a
-        params['b'] = self.b
-        params['c'] = self.c
-        params['alpha'] = self.alpha
-        params['beta'] = self.beta
-        params['gamma'] = self.gamma
-        params['natoms'] = self.natoms
-
-        params['potential_energy'] = self.potential_energy
-        params['cohesive_energy'] = self.cohesive_energy
-
+        params = {'name': self.name}
+        params.update(zip(_METADATA_FIELDS, self.__metadata_values()))
         return params
 
+    def __metadata_values(self) -> tuple:
+        """tuple : The metadata values after name, gathered once per loaded model"""
+        if self.__metadata is None:
+            self.__metadata = _get_metadata(self)
+        return self.__metadata
+
+    @classmethod
+    def metadata_frame(cls, records: Iterable['RelaxedCrystal']) -> pd.DataFrame:
+        """
+        Builds a pandas.DataFrame of the metadata for multiple records.  The
+        result matches a DataFrame built from a list of metadata() dicts, but
+        is assembled column by column with the numeric columns converted
+        directly to typed arrays.
+
+        Parameters
+        ----------
+        records : iterable of RelaxedCrystal
+            The records to include, one per row.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The metadata table.
+        """
+        # Gather the values for each record then regroup them by column
+        rows = [(record.name,) + record.__metadata_values() for record in records]
+        if len(rows) > 0:
+            columns = zip(*rows)
+        else:
+            columns = [()] * (len(_METADATA_FIELDS) + 1)
+
+        data = {}
+        for field, values in zip(('name',) + _METADATA_FIELDS, columns):
+            dtype = _METADATA_DTYPES.get(field, None)
+            if dtype is None:
+                data[field] = list(values)
+            else:
+                data[field] = np.array(values, dtype=dtype)
+
+        return pd.DataFrame(data, copy=False)
+
+    # Query objects shared by all instances, built on first use for each modelroot
+    __queries = {}
+
     @property
     def queries(self) -> dict:
         """dict: Query objects and their associated parameter names."""
+        # The queries only depend on modelroot so they are built once
+        modelroot = self.modelroot
+        queries = RelaxedCrystal.__queries.get(modelroot, None)
+        if queries is None:
+            queries = RelaxedCrystal.__queries[modelroot] = self.__build_queries()
+        return dict(queries)
+
+    def __build_queries(self) -> dict:
+        """Builds the Query objects listed by queries"""
         return {
             'key': load_query(
                 style='str_match',
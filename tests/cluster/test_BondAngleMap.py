@@ -0,0 +1,162 @@
+# coding: utf-8
+
+# https://docs.pytest.org/en/latest/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+from atomman.cluster import BondAngleMap
+
+class Test_BondAngleMap:
+    def test_set_range(self):
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0, thetanum=5)
+        assert len(bam.df) == 3 * 3 * 5
+        assert np.allclose(bam.df.r_ij[:15], 1.0)
+        assert np.allclose(bam.df.r_ik[:5], 1.0)
+        assert np.allclose(bam.df.r_ik[5:10], 2.0)
+        assert np.allclose(bam.df.theta[:5], [30.0, 60.0, 90.0, 120.0, 150.0])
+        assert np.all(np.isnan(bam.df.energy))
+        assert np.allclose(bam.theta_rad, np.radians(bam.df.theta))
+
+        # Check r_jk against the law of cosines
+        r_jk = np.sqrt(bam.df.r_ij**2 + bam.df.r_ik**2
+                       - 2 * bam.df.r_ij * bam.df.r_ik * np.cos(np.radians(bam.df.theta)))
+        assert np.allclose(bam.df.r_jk, r_jk)
+
+    def test_set_explicit(self):
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0, thetanum=5)
+        regular = BondAngleMap(r_ij=bam.df.r_ij, r_ik=bam.df.r_ik, theta=bam.df.theta)
+        assert regular.rnum == 3
+        assert regular.thetanum == 5
+        assert np.isclose(regular.rmax, 3.0)
+        assert np.allclose(regular.df.r_jk, bam.df.r_jk)
+
+        irregular = BondAngleMap(r_ij=bam.df.r_ij[::-1], r_ik=bam.df.r_ik[::-1],
+                                 theta=bam.df.theta[::-1])
+        assert irregular.rnum is None
+        assert irregular.thetanum is None
+        assert np.allclose(irregular.df.r_jk, bam.df.r_jk[::-1])
+
+    def test_itercoords(self):
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0, thetanum=5)
+        coords = np.array(list(bam.itercoords()))
+        assert coords.shape == (45, 4)
+        assert np.allclose(coords, bam.df[['r_ij', 'r_ik', 'r_jk', 'theta']].values)
+
+    def test_save_load_table(self, tmp_path):
+        energy = np.random.default_rng(1).normal(size=45)
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0,
+                           thetanum=5, energy=energy)
+        filename = tmp_path / 'table.txt'
+        bam.save_table(filename)
+
+        with open(filename, encoding='UTF-8') as f:
+            lines = [line for line in f if line[0] != '#']
+        assert len(lines) == 3 + 45
+        assert lines[4].split()[:3] == ['1', '1', '2']
+
+        loaded = BondAngleMap(rmin=1.0, rmax=2.0, rnum=2, thetamin=0.0, thetamax=1.0, thetanum=2)
+        loaded.load_table(filename)
+        assert loaded.rnum == 3
+        assert loaded.thetanum == 5
+        assert np.allclose(loaded.df.values, bam.df.values)
+
+    def test_dtype(self):
+        bam64 = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0, thetanum=5)
+        bam32 = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0, thetanum=5,
+                             dtype=np.float32)
+        assert bam64.dtype == np.float64
+        assert bam32.dtype == np.float32
+        assert np.all(bam32.df.dtypes == np.float32)
+        assert np.allclose(bam32.df.r_jk, bam64.df.r_jk)
+
+    def test_pdf(self):
+        energy = np.linspace(-2.0, 2.0, 45)
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0,
+                           thetanum=5, energy=energy)
+        pdf, centers = bam.pdf(nbins=4, energymin=-1.0, energymax=1.0)
+        assert np.allclose(centers, [-0.75, -0.25, 0.25, 0.75])
+        assert np.allclose(pdf, np.histogram(energy, bins=4, range=(-1.0, 1.0))[0] / 45)
+
+        cum_pdf, centers = bam.cumulative_pdf(nbins=4, energymin=-1.0, energymax=1.0)
+        assert np.isclose(cum_pdf[-1], np.sum(energy <= 1.0) / 45)
+
+        # New energies replace previously computed results
+        bam.set(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0,
+                thetanum=5, energy=np.zeros(45))
+        pdf, centers = bam.pdf(nbins=4, energymin=-1.0, energymax=1.0)
+        assert np.allclose(pdf, [0.0, 0.0, 1.0, 0.0])
+
+    def test_itersystem(self):
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0,
+                           thetanum=5, symbols='Si')
+        theta = np.radians(bam.df.theta.values)
+        k_pos = np.array([bam.df.r_ik * np.cos(theta), bam.df.r_ik * np.sin(theta)]).T
+
+        # New systems own their positions
+        system = next(bam.itersystem(copy=True))
+        assert system.atoms.pos.base is None
+
+        for copy in [False, True]:
+            systems = []
+            for system in bam.itersystem(copy=copy):
+                assert system.natoms == 3
+                assert system.symbols == ('Si',)
+                systems.append(system.atoms.pos.copy())
+            systems = np.array(systems)
+            assert np.allclose(systems[:, 0], 0.0)
+            assert np.allclose(systems[:, 1, 0], bam.df.r_ij)
+            assert np.allclose(systems[:, 2, :2], k_pos)
+            assert np.allclose(systems[:, 1:, 2], 0.0)
+
+    def test_load_table_unordered(self, tmp_path):
+        filename = tmp_path / 'table.txt'
+        with open(filename, 'w', encoding='UTF-8') as f:
+            f.write('# unordered table\n')
+            f.write('1.0 2.0 2\n1.0 2.0 2\n90.0 180.0 2\n')
+            for i, j, k in np.indices((2, 2, 2)).reshape(3, -1).T[::-1]:
+                f.write(f'{i+1} {j+1} {k+1} {100*i + 10*j + k}.0\n')
+
+        bam = BondAngleMap(rmin=1.0, rmax=2.0, rnum=2, thetamin=0.0, thetamax=1.0, thetanum=2)
+        bam.load_table(filename)
+        assert np.allclose(bam.df.energy, [0, 1, 10, 11, 100, 101, 110, 111])
+
+    def test_itersystem_symbols(self):
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0,
+                           thetanum=5, symbols=['Si', 'C', 'Si'])
+        for copy in [False, True]:
+            system = next(bam.itersystem(copy=copy))
+            assert system.symbols == ('C', 'Si')
+            assert np.array_equal(system.atoms.atype, [2, 1, 2])
+
+        system = next(bam.itersystem(symbols='Ge'))
+        assert system.symbols == ('Ge',)
+        assert np.array_equal(system.atoms.atype, [1, 1, 1])
+
+    def test_energy_edits(self):
+        bam = BondAngleMap(rmin=1.0, rmax=3.0, rnum=3, thetamin=30.0, thetamax=150.0, thetanum=5)
+        assert np.all(np.isnan(bam.energy))
+        with pytest.raises(ValueError):
+            bam.energy[0] = 1.0
+
+        # Energies set with the energy attribute
+        bam.energy = np.zeros(45)
+        pdf, centers = bam.pdf(nbins=4, energymin=-1.0, energymax=1.0)
+        assert np.allclose(pdf, [0.0, 0.0, 1.0, 0.0])
+        assert np.allclose(bam.df.energy, 0.0)
+        with pytest.raises(ValueError):
+            bam.energy = np.zeros(10)
+
+        # Energies replaced or modified through df
+        energy = np.linspace(-1.0, 1.0, 45)
+        bam.df['energy'] = energy
+        pdf, centers = bam.pdf(nbins=4, energymin=-1.0, energymax=1.0)
+        assert np.allclose(pdf, np.histogram(energy, bins=4, range=(-1.0, 1.0))[0] / 45)
+        bam.df.loc[:, 'energy'] = 0.5
+        pdf, centers = bam.pdf(nbins=4, energymin=-1.0, energymax=1.0)
+        assert np.allclose(pdf, [0.0, 0.0, 0.0, 1.0])
+        assert np.allclose(bam.energy, 0.5)
+
+        # The energies are not duplicated by df
+        assert np.shares_memory(bam.energy, bam.df['energy'].to_numpy())
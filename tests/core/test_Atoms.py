@@ -17,6 +17,21 @@ class Test_Atoms:
         assert np.allclose(atoms.pos[0], np.zeros(3))
         assert len(atoms) == atoms.natoms
 
+    def test_pos_storage(self):
+        atoms = am.Atoms(pos=[[0, 0, 0], [1, 2, 3]])
+        assert atoms.pos.dtype == np.float64
+        atoms.pos[1] += 0.5
+        assert np.allclose(atoms.pos[1], [1.5, 2.5, 3.5])
+
+        table = np.arange(12, dtype=float).reshape(2, 6)
+        atoms = am.Atoms(pos=table[:, 3:])
+        assert atoms.pos.flags.c_contiguous
+        assert np.allclose(atoms.pos, [[3, 4, 5], [9, 10, 11]])
+
+        pos = np.zeros((2, 3))
+        atoms = am.Atoms(pos=pos)
+        assert atoms.pos is pos
+
     def build_example(self):
         atoms = am.Atoms(pos=[[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]], atype=[2,1])
         atoms.test1 = np.array(['a', 'b'])
@@ -1,5 +1,8 @@
 # coding: utf-8
 
+# Standard Python libraries
+from copy import deepcopy
+
 # https://docs.pytest.org/en/latest/
 import pytest
 
@@ -272,4 +275,40 @@ class Test_Box:
         box = am.Box(model=model)
         assert np.allclose(box.vects, np.array([[5.42, 0.0, 0.0],
                                                 [0.0, 5.42, 0.0], 
-                                                [0.0, 0.0, 5.42]]))
\ No newline at end of file
+                                                [0.0, 0.0, 5.42]]))
+
+    def test_position_conversions(self):
+        box = am.Box(avect=[4.0, 0.0, 0.0], bvect=[1.0, 5.0, 0.0],
+                     cvect=[-1.0, 2.0, 6.0], origin=[1.0, -2.0, 3.0])
+        relpos = [[0.0, 0.0, 0.0], [0.5, 0.25, 0.75], [1.0, 1.0, 1.0]]
+        cartpos = box.position_relative_to_cartesian(relpos)
+        assert np.allclose(cartpos[0], box.origin)
+        assert np.allclose(cartpos[2], box.origin + box.avect + box.bvect + box.cvect)
+        assert np.allclose(box.position_cartesian_to_relative(cartpos), relpos)
+        assert np.allclose(box.position_cartesian_to_relative(cartpos.tolist()), relpos)
+
+        # Cached reciprocal vectors are read-only and updated when vects change
+        recip = box.reciprocal_vects
+        assert box.reciprocal_vects is recip
+        assert not recip.flags.writeable
+        assert np.allclose(recip, np.linalg.inv(box.vects).T)
+        box.set(vects=2 * box.vects, origin=box.origin)
+        assert np.allclose(box.reciprocal_vects, recip / 2)
+        assert np.allclose(box.position_cartesian_to_relative(cartpos[2]), [0.5, 0.5, 0.5])
+
+    def test_deepcopy(self):
+        class SubBox(am.Box):
+            pass
+        box = SubBox(avect=[4.0, 0.0, 0.0], bvect=[1.0, 5.0, 0.0],
+                     cvect=[0.0, 0.0, 6.0], origin=[1.0, 0.0, 0.0])
+        box.note = ['strained']
+        newbox = deepcopy(box)
+        assert type(newbox) is SubBox
+        assert np.allclose(newbox.vects, box.vects)
+        assert np.allclose(newbox.origin, box.origin)
+        assert newbox.note == ['strained']
+        assert newbox.note is not box.note
+
+        # Changes to the copy do not affect the original
+        newbox.set(vects=2 * newbox.vects)
+        assert np.allclose(box.avect, [4.0, 0.0, 0.0])
@@ -75,4 +75,64 @@ def test_hcp():
     # Test no periodic boundaries
     system.pbc = [False, False, False]
     neighbors = system.neighborlist(cutoff=cutoff)
-    assert np.isclose(neighbors.coord.mean(), 11.4411)
\ No newline at end of file
+    assert np.isclose(neighbors.coord.mean(), 11.4411)
+
+def test_csr(tmp_path):
+    
+    # Build small fcc test system with free surfaces for varied coordination
+    a = 4.05
+    ucell = am.System(atoms=am.Atoms(pos=[[0.0, 0.0, 0.0],
+                                          [0.5, 0.5, 0.0],
+                                          [0.5, 0.0, 0.5],
+                                          [0.0, 0.5, 0.5]]), 
+                      box=am.Box.cubic(a),
+                      scale=True)
+    system = ucell.supersize(3, 3, 3)
+    system.pbc = [True, False, False]
+    neighbors = system.neighborlist(cutoff=0.9 * a)
+
+    # Check CSR arrays against the per-atom neighbor lists
+    assert neighbors.offsets[0] == 0
+    assert np.array_equal(np.diff(neighbors.offsets), neighbors.coord)
+    for i in range(system.natoms):
+        start, end = neighbors.offsets[i:i+2]
+        assert np.array_equal(neighbors.indices[start:end], neighbors[i])
+    
+    # Check that dump and load preserve the neighbors
+    fname = tmp_path / 'neighbors.txt'
+    neighbors.dump(fname)
+    loaded = am.NeighborList(model=str(fname))
+    assert np.array_equal(loaded.offsets, neighbors.offsets)
+    assert np.array_equal(loaded.indices, neighbors.indices)
+
+def test_skin_update():
+    
+    # Build small fcc test system
+    a = 4.05
+    ucell = am.System(atoms=am.Atoms(pos=[[0.0, 0.0, 0.0],
+                                          [0.5, 0.5, 0.0],
+                                          [0.5, 0.0, 0.5],
+                                          [0.0, 0.5, 0.5]]), 
+                      box=am.Box.cubic(a),
+                      scale=True)
+    system = ucell.supersize(4, 4, 4)
+    cutoff = 0.75 * a
+    skin = 0.2 * a
+    neighbors = system.neighborlist(cutoff=cutoff, skin=skin)
+    reference = system.neighborlist(cutoff=cutoff + skin)
+    assert np.array_equal(neighbors.indices, reference.indices)
+
+    # Small displacements keep the current list
+    system.atoms.pos[0] += [0.09 * a, 0.0, 0.0]
+    assert neighbors.update(system) is False
+
+    # Larger displacements trigger a rebuild
+    system.atoms.pos[0] += [0.02 * a, 0.0, 0.0]
+    assert neighbors.update(system) is True
+    reference = system.neighborlist(cutoff=cutoff + skin)
+    assert np.array_equal(neighbors.indices, reference.indices)
+    assert neighbors.update(system) is False
+
+    # Box changes trigger a rebuild
+    system.box_set(vects=1.01 * system.box.vects, scale=True)
+    assert neighbors.update(system) is True
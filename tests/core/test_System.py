@@ -1,9 +1,176 @@
 # coding: utf-8
 
+# Standard Python libraries
+from copy import deepcopy
+
 # https://docs.pytest.org/en/latest/
 import pytest
 
 # http://www.numpy.org/
 import numpy as np
 
-import atomman as am
\ No newline at end of file
+import atomman as am
+
+class Test_System:
+    def test_wrap(self):
+        box = am.Box(avect=[4.0, 0.0, 0.0], bvect=[1.0, 5.0, 0.0], cvect=[0.0, 0.0, 6.0])
+        spos = np.array([[0.25, 0.5, 0.5], [1.25, -0.5, 0.5], [-0.75, 0.5, 1.5]])
+        atoms = am.Atoms(pos=box.position_relative_to_cartesian(spos))
+        system = am.System(atoms=atoms, box=box, pbc=(True, True, False))
+
+        imageflags = system.wrap(return_imageflags=True)
+        assert np.array_equal(imageflags, [[0, 0, 0], [1, -1, 0], [-1, 0, 0]])
+        assert np.allclose(system.box.avect, [4.0, 0.0, 0.0])
+        assert np.allclose(system.box.bvect, [1.0, 5.0, 0.0])
+        assert np.allclose(system.box.cvect, [0.0, 0.0, 6.0 * 1.501])
+        assert np.allclose(system.box.origin, [0.0, 0.0, 0.0])
+        assert np.allclose(system.atoms_prop('pos', scale=True)[:, :2],
+                           [[0.25, 0.5], [0.25, 0.5], [0.25, 0.5]])
+
+        # Non-periodic bounds also extend below the origin
+        system.pbc = (False, True, True)
+        system.atoms.pos[0] -= system.box.avect
+        system.wrap()
+        assert np.allclose(system.box.avect, [4.0 * 1.751, 0.0, 0.0])
+        assert np.allclose(system.box.origin, [-4.0 * 0.751, 0.0, 0.0])
+
+    def test_box_set_scale(self):
+        box = am.Box(avect=[4.0, 0.0, 0.0], bvect=[1.0, 5.0, 0.0], cvect=[0.0, 0.0, 6.0])
+        spos = np.array([[0.25, 0.5, 0.5], [0.75, 0.1, 0.9]])
+        atoms = am.Atoms(pos=box.position_relative_to_cartesian(spos))
+        system = am.System(atoms=atoms, box=box)
+
+        system.box_set(avect=[5.0, 0.0, 0.0], bvect=[0.0, 5.0, 1.0],
+                       cvect=[0.5, 0.0, 7.0], origin=[1.0, 2.0, 3.0], scale=True)
+        assert np.allclose(system.atoms_prop('pos', scale=True), spos)
+
+        # Positions are not rescaled if the block raises
+        pos = system.atoms.pos.copy()
+        with pytest.raises(ValueError):
+            with system.scaled_positions() as held:
+                system.box_set(vects=2 * system.box.vects)
+                held[0] = 0.0
+                raise ValueError('abort')
+        assert np.allclose(system.atoms.pos, pos)
+
+        pos = system.atoms.pos
+        system.box_set(vects=system.box.vects, origin=system.box.origin, scale=True)
+        assert np.allclose(system.atoms.pos, pos)
+
+        system.box_set(vects=4 * system.box.vects, scale=False)
+        assert np.allclose(system.atoms.pos, pos)
+
+    def test_dvect_dmag(self):
+        box = am.Box.cubic(4.0)
+        pos = np.array([[0.5, 0.5, 0.5], [3.5, 0.5, 0.5], [0.5, 2.0, 3.0]])
+        system = am.System(atoms=am.Atoms(pos=pos), box=box)
+
+        # Atom indices and position values give the same results
+        assert np.allclose(system.dvect(0, 1), [-1.0, 0.0, 0.0])
+        assert np.allclose(system.dvect(pos[0], pos[1]), [-1.0, 0.0, 0.0])
+        assert np.allclose(system.dvect(0, [1, 2]), [[-1.0, 0.0, 0.0], [0.0, 1.5, -1.5]])
+        assert np.allclose(system.dvect(pos[0], pos[1:]), system.dvect(0, slice(1, None)))
+        assert np.allclose(system.dvect(0, range(1, 3)), system.dvect(0, [1, 2]))
+        assert np.allclose(system.dvect(0, range(2, 0, -1)), system.dvect(0, [2, 1]))
+        assert np.allclose(system.dmag(0, [1, 2]), [1.0, 4.5**0.5])
+        assert np.allclose(system.dmag(pos[0], pos[1:]), [1.0, 4.5**0.5])
+
+        # Out of bounds ranges are not truncated like slices
+        with pytest.raises(ValueError):
+            system.dmag(0, range(1, 10))
+
+        system.pbc = [False, False, False]
+        assert np.isclose(system.dmag(0, 1), 3.0)
+
+    def test_pbc(self):
+        system = am.System(pbc=(True, False, True))
+        assert system.pbc.dtype == bool
+        assert np.array_equal(system.pbc, [True, False, True])
+
+        # Systems built from another system's pbc do not share it
+        newsystem = am.System(atoms=system.atoms, box=system.box, pbc=system.pbc)
+        newsystem.pbc[0] = False
+        assert system.pbc[0]
+
+    def test_scaled_positions(self):
+        box = am.Box(avect=[4.0, 0.0, 0.0], bvect=[1.0, 5.0, 0.0], cvect=[0.0, 0.0, 6.0])
+        spos = np.array([[0.25, 0.5, 0.5], [0.75, 0.1, 0.9]])
+        atoms = am.Atoms(pos=box.position_relative_to_cartesian(spos))
+        system = am.System(atoms=atoms, box=box)
+
+        with system.scaled_positions() as held:
+            assert np.allclose(held, spos)
+            system.box_set(vects=2 * system.box.vects)
+            system.box_set(origin=[1.0, 1.0, 1.0])
+            held[1, 0] = 0.5
+        
+        spos[1, 0] = 0.5
+        assert np.allclose(system.box.avect, [8.0, 0.0, 0.0])
+        assert np.allclose(system.atoms_prop('pos', scale=True), spos)
+
+    def test_deepcopy(self):
+        box = am.Box(avect=[4.0, 0.0, 0.0], bvect=[1.0, 5.0, 0.0], cvect=[0.0, 0.0, 6.0])
+        atoms = am.Atoms(atype=[1, 2], pos=[[0.5, 0.5, 0.5], [1.0, 2.0, 3.0]], charge=[1.0, -1.0])
+        system = am.System(atoms=atoms, box=box, pbc=(True, False, True),
+                           symbols=['Na', 'Cl'], masses=[22.99, 35.45])
+        
+        newsystem = deepcopy(system)
+        assert newsystem.symbols == system.symbols
+        assert newsystem.masses == system.masses
+        assert np.array_equal(newsystem.pbc, system.pbc)
+        assert np.allclose(newsystem.box.vects, system.box.vects)
+        assert np.allclose(newsystem.atoms.pos, system.atoms.pos)
+        assert np.allclose(newsystem.atoms.charge, system.atoms.charge)
+        assert np.allclose(newsystem.atoms_ix[1].atoms.pos, [[1.0, 2.0, 3.0]])
+
+        # Changes to the copy do not affect the original
+        newsystem.atoms.pos[0] += 1.0
+        newsystem.box_set(vects=2 * newsystem.box.vects)
+        newsystem.pbc[0] = False
+        assert np.allclose(system.atoms.pos[0], [0.5, 0.5, 0.5])
+        assert np.allclose(system.box.avect, [4.0, 0.0, 0.0])
+        assert system.pbc[0]
+
+        # Subclasses and user-defined attributes are preserved
+        class SubSystem(am.System):
+            pass
+        subsystem = SubSystem(atoms=atoms, box=box)
+        subsystem.note = ['relaxed']
+        newsubsystem = deepcopy(subsystem)
+        assert type(newsubsystem) is SubSystem
+        assert newsubsystem.note == ['relaxed']
+        assert newsubsystem.note is not subsystem.note
+
+    def test_float32_pos(self):
+        a = 4.05
+        ucell = am.System(atoms=am.Atoms(pos=[[0.0, 0.0, 0.0], [0.5, 0.5, 0.0],
+                                              [0.5, 0.0, 0.5], [0.0, 0.5, 0.5]]),
+                          box=am.Box.cubic(a), scale=True)
+        system64 = ucell.supersize(3, 3, 3)
+        atoms = am.Atoms(atype=system64.atoms.atype,
+                         pos=system64.atoms.pos.astype(np.float32))
+        system32 = am.System(atoms=atoms, box=system64.box)
+        assert system32.atoms.pos.dtype == np.float32
+
+        system32.atoms.pos[0] -= system32.box.avect
+        system32.wrap()
+        assert system32.atoms.pos.dtype == np.float32
+        assert 0.0 <= system32.atoms.pos[0, 0] < system32.box.lx
+        
+        neighbors = system32.neighborlist(cutoff=0.8 * a)
+        assert np.all(neighbors.coord == 12)
+        assert np.allclose(system32.dmag(1, neighbors[1]), a / 2**0.5, atol=1e-5)
+
+    def test_all_dvects(self):
+        box = am.Box(avect=[4.0, 0.0, 0.0], bvect=[1.0, 5.0, 0.0], cvect=[0.0, 0.0, 6.0])
+        pos = np.random.default_rng(2).uniform(0.0, 4.0, size=(7, 3))
+        system = am.System(atoms=am.Atoms(pos=pos), box=box, pbc=(True, False, True))
+
+        vects = system.all_dvects()
+        assert vects.shape == (7, 7, 3)
+        assert np.allclose(vects[np.arange(7), np.arange(7)], 0.0)
+        assert np.allclose(vects, -vects.transpose(1, 0, 2))
+        for i in range(7):
+            assert np.allclose(vects[i], system.dvect(i, range(7)))
+        
+        assert np.allclose(system.all_dvects(pos[:3]), vects[:3, :3])
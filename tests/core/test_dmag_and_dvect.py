@@ -41,4 +41,50 @@ def test_dmag_and_dvect():
     assert np.allclose(dvect[10], [0.0, 0.0, 0.0])
     assert np.allclose(dvect[11], [11., -131.,  -11.])
     assert np.isclose(dmag[10], 0.0)
-    assert np.isclose(dmag[11], 131.92043056327552)
\ No newline at end of file
+    assert np.isclose(dmag[11], 131.92043056327552)
+
+def test_orthogonal():
+    rng = np.random.default_rng(8937)
+    pos_0 = rng.uniform(0.0, 1.0, size=(200,3))
+    pos_1 = rng.uniform(0.0, 1.0, size=(200,3))
+
+    ortho = am.Box(vects=[[3.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 5.0]])
+    for pbc in [[True, True, True], [True, False, True]]:
+        pos_0c = ortho.position_relative_to_cartesian(pos_0)
+        pos_1c = ortho.position_relative_to_cartesian(pos_1)
+        dvect = am.dvect(pos_0c, pos_1c, ortho, pbc)
+        
+        # Brute force search of all neighboring images
+        d = pos_1c - pos_0c
+        best = d.copy()
+        for shift in np.indices((3, 3, 3)).reshape(3, -1).T - 1:
+            shift = shift * pbc
+            test = d + shift.dot(ortho.vects)
+            replace = np.linalg.norm(test, axis=1) < np.linalg.norm(best, axis=1)
+            best[replace] = test[replace]
+        assert np.allclose(dvect, best)
+        assert np.allclose(am.dmag(pos_0c, pos_1c, ortho, pbc), np.linalg.norm(best, axis=1))
+
+    # Positions several periods apart
+    pbc = [True, True, True]
+    assert np.allclose(am.dvect([0.0, 0.0, 0.0], [7.0, -9.0, 13.0], ortho, pbc), [1.0, -1.0, -2.0])
+    assert np.isclose(am.dmag([0.0, 0.0, 0.0], [7.0, -9.0, 13.0], ortho, pbc), 6.0**0.5)
+
+def test_tilted():
+    # Nearly orthogonal tilted boxes match the orthogonal results
+    ortho = am.Box(vects=[[4.0, 0.0, 0.0], [0.0, 4.0, 0.0], [0.0, 0.0, 4.0]])
+    tilted = am.Box(vects=[[4.0, 0.0, 0.0], [1e-4, 4.0, 0.0], [0.0, 0.0, 4.0]])
+    pbc = [True, True, True]
+    for box in [ortho, tilted]:
+        assert np.allclose(am.dvect([0.0, 0.0, 0.0], [9.0, 0.0, 0.0], box, pbc), [1.0, 0.0, 0.0])
+        assert np.isclose(am.dmag([0.0, 0.0, 0.0], [9.0, 0.0, 0.0], box, pbc), 1.0)
+        assert np.allclose(am.dvect([0.0, 0.0, 0.0], [0.5, -10.5, 13.0], box, pbc), [0.5, 1.5, 1.0], atol=1e-3)
+
+    # Positions several periods apart in a strongly tilted box
+    rng = np.random.default_rng(2201)
+    box = am.Box(vects=[[3.0, 0.0, 0.0], [1.2, 4.0, 0.0], [-0.8, 0.9, 5.0]])
+    pos_0 = box.position_relative_to_cartesian(rng.uniform(0.0, 1.0, size=(100,3)))
+    pos_1 = box.position_relative_to_cartesian(rng.uniform(0.0, 1.0, size=(100,3)))
+    shift = rng.integers(-5, 6, size=(100,3)).dot(box.vects)
+    assert np.allclose(am.dvect(pos_0, pos_1 + shift, box, pbc), am.dvect(pos_0, pos_1, box, pbc))
+    assert np.allclose(am.dmag(pos_0, pos_1 + shift, box, pbc), am.dmag(pos_0, pos_1, box, pbc))
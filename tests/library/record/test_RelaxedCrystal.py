@@ -0,0 +1,172 @@
+# coding: utf-8
+
+# https://docs.pytest.org/en/latest/
+import pytest
+
+# http://www.numpy.org/
+import numpy as np
+
+# https://pandas.pydata.org/
+import pandas as pd
+
+# https://github.com/usnistgov/DataModelDict
+from DataModelDict import DataModelDict as DM
+
+import atomman as am
+from atomman.library.record.RelaxedCrystal import RelaxedCrystal
+
+def relaxed_crystal_model(key='4b1f5e2a', a=3.6):
+    """Builds a minimal relaxed_crystal model for an fcc unit cell"""
+    box = am.Box.cubic(a)
+    atoms = am.Atoms(pos=[[0.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.5, 0.0, 0.5], [0.0, 0.5, 0.5]])
+    ucell = am.System(atoms=atoms, box=box, scale=True, symbols='Cu')
+
+    model = DM()
+    model['relaxed-crystal'] = crystal = DM()
+    crystal['key'] = key
+    crystal['method'] = 'dynamic'
+    crystal['standing'] = 'good'
+    crystal['potential-LAMMPS'] = DM()
+    crystal['potential-LAMMPS']['key'] = 'imp-key'
+    crystal['potential-LAMMPS']['id'] = 'imp-id'
+    crystal['potential-LAMMPS']['potential'] = DM()
+    crystal['potential-LAMMPS']['potential']['key'] = 'pot-key'
+    crystal['potential-LAMMPS']['potential']['id'] = 'pot-id'
+    crystal['phase-state'] = DM()
+    crystal['phase-state']['temperature'] = DM([('value', 300.0), ('unit', 'K')])
+    crystal['system-info'] = DM()
+    crystal['system-info']['family'] = 'A1--Cu--fcc'
+    crystal['system-info']['parent_key'] = 'parent-key'
+    crystal['system-info']['symbol'] = 'Cu'
+    crystal['system-info']['composition'] = 'Cu'
+    crystal['system-info']['cell'] = cell = DM()
+    cell['crystal-family'] = 'cubic'
+    cell['natypes'] = 1
+    for name, value in zip(['a', 'b', 'c', 'alpha', 'beta', 'gamma'], [a, a, a, 90.0, 90.0, 90.0]):
+        cell[name] = value
+    crystal['atomic-system'] = ucell.model()['atomic-system']
+    crystal['potential-energy'] = DM([('value', -3.54), ('unit', 'eV')])
+    crystal['cohesive-energy'] = DM([('value', -3.54), ('unit', 'eV')])
+    return model
+
+class Test_RelaxedCrystal:
+    def test_attributes(self):
+        record = RelaxedCrystal(model=relaxed_crystal_model())
+        assert record.name == record.key == '4b1f5e2a'
+        assert record.url is None
+        assert record.potential_LAMMPS_id == 'imp-id'
+        assert record.potential_key == 'pot-key'
+        assert record.symbols == ['Cu']
+        assert record.natoms == 4
+        assert np.isclose(record.a, 3.6)
+        assert np.isclose(record.temperature, 300.0)
+        assert np.isclose(record.pressure_xx, 0.0)
+        assert np.isclose(record.cohesive_energy, -3.54)
+        assert record.ucell.natoms == 4
+
+        # Loading a new model replaces the values
+        record.load_model(relaxed_crystal_model(key='9c0d', a=4.0))
+        assert record.key == '9c0d'
+        assert np.isclose(record.b, 4.0)
+
+        with pytest.raises(AttributeError):
+            RelaxedCrystal().key
+        assert RelaxedCrystal.key.__doc__.startswith('str : ')
+
+        # Model-derived attributes are read-only
+        with pytest.raises(AttributeError):
+            record.key = 'changed'
+        with pytest.raises(AttributeError):
+            del record.a
+        assert record.key == '9c0d'
+
+    def test_ucell(self):
+        record = RelaxedCrystal(model=relaxed_crystal_model())
+        ucell = record.ucell
+        assert record.ucell is ucell
+        assert np.isclose(ucell.box.a, 3.6)
+
+        # The cached unit cell is rebuilt after a new model is loaded
+        record.load_model(relaxed_crystal_model(a=4.0))
+        assert record.ucell is not ucell
+        assert np.isclose(record.ucell.box.a, 4.0)
+
+    def test_lazy_parse(self):
+        model = relaxed_crystal_model()
+        record = RelaxedCrystal(model=model)
+        assert 'composition' not in vars(record)['_modelvalues']
+        assert record.composition == 'Cu'
+        assert vars(record)['_modelvalues']['composition'] == 'Cu'
+
+        # Missing optional elements use defaults, missing required ones raise
+        del model['relaxed-crystal']['system-info']['cell']['c']
+        record = RelaxedCrystal(model=model)
+        assert record.family_url is None
+        assert np.isclose(record.a, 3.6)
+        with pytest.raises(KeyError):
+            record.c
+
+        # key is only needed at load when no name is given
+        del model['relaxed-crystal']['key']
+        with pytest.raises(KeyError):
+            RelaxedCrystal(model=model)
+        assert RelaxedCrystal(model=model, name='named').name == 'named'
+
+    def test_queries(self):
+        record = RelaxedCrystal(model=relaxed_crystal_model())
+        queries = record.queries
+        assert queries['natoms'] is RelaxedCrystal().queries['natoms']
+
+        # Modifying the returned dict does not change the shared queries
+        queries.pop('key')
+        assert 'key' in record.queries
+
+        # Query paths follow modelroot
+        assert queries['natoms'].path == 'relaxed-crystal.atomic-system.atoms.natoms'
+        class OtherCrystal(RelaxedCrystal):
+            @property
+            def modelroot(self):
+                return 'other-crystal'
+        assert OtherCrystal().queries['natoms'].path == 'other-crystal.atomic-system.atoms.natoms'
+        assert record.queries['natoms'] is queries['natoms']
+
+        df = pd.DataFrame([record.metadata()])
+        assert record.pandasfilter(df, natoms=4).all()
+        assert not record.pandasfilter(df, composition='Ni').any()
+
+    def test_metadata(self):
+        record = RelaxedCrystal(model=relaxed_crystal_model())
+        meta = record.metadata()
+        assert list(meta)[:3] == ['name', 'key', 'url']
+        assert meta['natoms'] == 4
+        assert np.isclose(meta['potential_energy'], -3.54)
+
+        # Returned dicts are independent and follow name and model changes
+        meta['natoms'] = 8
+        assert record.metadata()['natoms'] == 4
+        record.name = 'renamed'
+        assert record.metadata()['name'] == 'renamed'
+        record.load_model(relaxed_crystal_model(a=4.0))
+        assert np.isclose(record.metadata()['a'], 4.0)
+
+    def test_metadata_frame(self):
+        records = [RelaxedCrystal(model=relaxed_crystal_model(key=f'key{i}', a=3.5 + 0.1 * i))
+                   for i in range(3)]
+        df = RelaxedCrystal.metadata_frame(records)
+        ref = pd.DataFrame([record.metadata() for record in records])
+        pd.testing.assert_frame_equal(df, ref)
+        assert df.a.dtype == np.float64
+        assert df.natoms.dtype == np.int64
+
+        empty = RelaxedCrystal.metadata_frame([])
+        assert len(empty) == 0
+        assert list(empty.columns) == list(ref.columns)
+
+    def test_unit_conversion(self):
+        model = relaxed_crystal_model()
+        model['relaxed-crystal']['phase-state']['pressure-xx'] = DM([('value', 1.0), ('unit', 'GPa')])
+        record = RelaxedCrystal(model=model)
+        assert 'potential_energy' not in vars(record)['_modelvalues']
+        assert np.isclose(record.potential_energy, -3.54)
+        assert np.isclose(record.pressure_xx, am.unitconvert.set_in_units(1.0, 'GPa'))
+        assert record.pressure_yy == 0.0